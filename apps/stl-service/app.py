@@ -17,6 +17,7 @@ from pydantic import BaseModel, Field
 
 from models import REGISTRY, ALIASES  # registro dinámico + alias para slugs
 from supabase_client import upload_and_get_url  # subida + URL firmada
+from utils.stl_writer import mesh_to_stl_bytes  # STL binario vectorizado
 
 # -------------------------------------------------------------------
 # Parches de compatibilidad (evitan errores en modelos antiguos)
@@ -125,6 +126,11 @@ SUPABASE_SERVICE_KEY = os.getenv("SUPABASE_SERVICE_KEY", "") or os.getenv("SUPAB
 SUPABASE_BUCKET = os.getenv("SUPABASE_BUCKET", "forge-stl")
 CLEANUP_TOKEN = os.getenv("CLEANUP_TOKEN", "")  # mantenimiento
 
+# Hilos del pool donde FastAPI ejecuta los endpoints síncronos (/generate).
+# La generación pasa casi todo el tiempo en numpy/manifold/shapely, que
+# liberan el GIL, así que varias peticiones se solapan de verdad. 0 = por defecto.
+BUILD_THREADS = int(os.getenv("FORGE_BUILD_THREADS", "0") or 0)
+
 # -------- Gate de negocio (env) ----------
 REQUIRE_ENTITLEMENT = os.getenv("FORGE_REQUIRE_ENTITLEMENT", "0") == "1"
 FORGE_FREE_SLUGS = {
@@ -153,6 +159,16 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.on_event("startup")
+def _configure_build_pool() -> None:
+    if BUILD_THREADS <= 0:
+        return
+    try:
+        from anyio.to_thread import current_default_thread_limiter
+        current_default_thread_limiter().total_tokens = BUILD_THREADS
+    except Exception as e:
+        print("[FORGE][threads] no se pudo ajustar el pool:", e, file=sys.stderr)
+
 # -------------------------- Schemas --------------------------
 
 class TextOp(BaseModel):
@@ -196,6 +212,8 @@ def _as_stl_bytes(obj: Any) -> Tuple[bytes, Optional[str]]:
                 return (f.read(), os.path.basename(obj))
         if obj.strip().startswith("solid"):
             return (obj.encode("utf-8"), None)
+    if isinstance(obj, trimesh.Trimesh):
+        return (mesh_to_stl_bytes(obj), None)
     if hasattr(obj, "export"):
         buf = io.BytesIO()
         try:
@@ -536,7 +554,9 @@ def generate(body: GenerateBody, request: Request):
                 texts = place_layers(result, [op.dict() for op in (body.text_ops or [])])
 
             from trimesh.visual import ColorVisuals
-            base = result.copy()
+            # `result` es de esta petición (los builders cacheados ya entregan
+            # copia) y solo se colorea para la escena: sin copia extra
+            base = result
             base.visual = ColorVisuals(base, face_colors=[210, 210, 210, 255])
 
             for t in texts:
@@ -564,12 +584,9 @@ def generate(body: GenerateBody, request: Request):
         from models import apply_text_ops as _applier
     except Exception:
         try:
-            from models.text import apply_text_ops as _applier
+            from models.text_ops import apply_text_ops as _applier
         except Exception:
-            try:
-                from models.text_ops import apply_text_ops as _applier
-            except Exception:
-                _applier = None
+            _applier = None
     if _applier and body.text_ops:
         try:
             result = _applier(result, [op.dict() for op in body.text_ops])
@@ -156,17 +156,12 @@ for k, v in _extra.items():
 
 # --------------------- Utilidad opcional de texto --------------------
 
-apply_text_ops = None  # type: ignore
-place_text_layers = None  # type: ignore
-for candidate in ("text", "text_ops"):
-    try:
-        m = importlib.import_module(f"{__name__}.{candidate}")
-        if hasattr(m, "apply_text_ops") and apply_text_ops is None:
-            apply_text_ops = getattr(m, "apply_text_ops")  # type: ignore
-        if hasattr(m, "place_text_layers") and place_text_layers is None:
-            place_text_layers = getattr(m, "place_text_layers")  # type: ignore
-    except Exception:
-        pass
+# Una sola implementación: models/text_ops.py
+try:
+    from .text_ops import apply_text_ops, place_text_layers
+except Exception:
+    apply_text_ops = None  # type: ignore
+    place_text_layers = None  # type: ignore
 
 # --------------------- API de ayuda (opcional) -----------------------
 
@@ -1,7 +1,9 @@
 # apps/stl-service/models/_booleans.py
 from __future__ import annotations
 import trimesh
-from typing import Iterable, Optional, List
+from typing import Iterable, Optional, List, Union
+
+from ._helpers import _BOOL_ENGINE, fast_concat
 
 def _valid(mesh: trimesh.Trimesh) -> bool:
     return isinstance(mesh, trimesh.Trimesh) and mesh.vertices.shape[0] > 0
@@ -15,34 +17,40 @@ def union(meshes: Iterable[trimesh.Trimesh]) -> Optional[trimesh.Trimesh]:
         return trimesh.Trimesh()
     try:
         from trimesh.boolean import union as _u
-        res = _u(ms, engine=None)
+        res = _u(ms, engine=_BOOL_ENGINE)
         if isinstance(res, trimesh.Trimesh):
             return res
         if isinstance(res, (list, tuple)):
-            return trimesh.util.concatenate([m for m in res if _valid(m)])
+            return fast_concat([m for m in res if _valid(m)])
     except Exception:
         pass
-    return trimesh.util.concatenate(ms)
+    return fast_concat(ms)
 
-def difference(a: trimesh.Trimesh, b: trimesh.Trimesh) -> Optional[trimesh.Trimesh]:
-    if not _valid(a) or not _valid(b):
+def difference(
+    a: trimesh.Trimesh, b: Union[trimesh.Trimesh, Iterable[trimesh.Trimesh]]
+) -> Optional[trimesh.Trimesh]:
+    """`a` menos `b`; `b` puede ser una lista de cortadores (una sola operación)."""
+    cutters = _prep([b] if isinstance(b, trimesh.Trimesh) else (b or []))
+    if not _valid(a) or not cutters:
         return a.copy() if _valid(a) else trimesh.Trimesh()
     try:
-        from trimesh.boolean import difference as _d
-        res = _d([a], [b], engine=None)
+        from trimesh.boolean import difference as _d, union as _u
+        # la diferencia de trimesh solo admite dos mallas: unimos los cortadores
+        tool = cutters[0] if len(cutters) == 1 else _u(cutters, engine=_BOOL_ENGINE)
+        res = _d([a, tool], engine=_BOOL_ENGINE)
         if isinstance(res, trimesh.Trimesh):
             return res
     except Exception:
         pass
     # último recurso: concatenar (no graba)
-    return trimesh.util.concatenate([a, b])
+    return fast_concat([a] + cutters)
 
 def intersection(a: trimesh.Trimesh, b: trimesh.Trimesh) -> Optional[trimesh.Trimesh]:
     if not _valid(a) or not _valid(b):
         return trimesh.Trimesh()
     try:
         from trimesh.boolean import intersection as _i
-        res = _i([a], [b], engine=None)
+        res = _i([a], [b], engine=_BOOL_ENGINE)
         if isinstance(res, trimesh.Trimesh):
             return res
     except Exception:
@@ -1,6 +1,11 @@
 from __future__ import annotations
 
-from typing import Iterable, Tuple, List, Any, Optional, Sequence
+import importlib.util
+import math
+import threading
+from collections import OrderedDict, namedtuple
+from functools import lru_cache, wraps
+from typing import Callable, Dict, Iterable, Tuple, List, Any, Optional, Sequence, Union
 import numpy as np
 import trimesh
 
@@ -28,6 +33,21 @@ def num(x: Any, default: Optional[float] = None) -> Optional[float]:
         return default
 
 
+def param_num(p: Dict[str, Any], k: str, default: float) -> float:
+    """`p[k]` como float (acepta "1,5"); `default` si falta o no es numérico."""
+    v = p.get(k, default)
+    # JSON ya trae números casi siempre: evitar el str()/replace() en ese caso.
+    # Tipos exactos: un bool no cuenta como número.
+    if type(v) is float:
+        return v
+    if type(v) is int:
+        return float(v)
+    try:
+        return float(str(v).replace(",", "."))
+    except Exception:
+        return default
+
+
 def parse_holes(holes_in: Iterable[Any]) -> List[Tuple[float, float, float]]:
     """
     Acepta:
@@ -35,8 +55,19 @@ def parse_holes(holes_in: Iterable[Any]) -> List[Tuple[float, float, float]]:
       - tuples/list: [x, y, diam]
     Devuelve: [(x, y, d), ...]
     """
+    if isinstance(holes_in, np.ndarray):
+        return _parse_hole_array(holes_in)
+    holes_in = holes_in or []
+    if isinstance(holes_in, (list, tuple)) and len(holes_in) > _HOLES_NP_MIN:
+        if type(holes_in[0]) is dict:
+            fast = _parse_hole_dicts_np(holes_in)
+        else:
+            fast = _parse_hole_rows_np(holes_in)
+        if fast is not None:
+            return fast
+
     out: List[Tuple[float, float, float]] = []
-    for h in holes_in or []:
+    for h in holes_in:
         if isinstance(h, dict):
             x = num(h.get("x"), 0.0)
             y = num(h.get("y"), 0.0)
@@ -58,11 +89,113 @@ def parse_holes(holes_in: Iterable[Any]) -> List[Tuple[float, float, float]]:
     return out
 
 
+# A partir de este número de agujeros compensa leer los campos con numpy.
+_HOLES_NP_MIN = 64
+
+
+def _parse_hole_dicts_np(holes: Sequence[Any]) -> Optional[List[Tuple[float, float, float]]]:
+    """
+    Variante vectorizada de `parse_holes` para listas grandes de dicts numéricos.
+    Devuelve None si la entrada no encaja (strings, tuplas mezcladas...) para
+    que el llamante use el bucle general.
+    """
+    if not all(type(h) is dict for h in holes):
+        return None
+    n = len(holes)
+    try:
+        x = np.fromiter((h.get("x") or 0.0 for h in holes), dtype=np.float64, count=n)
+        y = np.fromiter((h.get("y") or 0.0 for h in holes), dtype=np.float64, count=n)
+        d = np.fromiter(
+            (
+                h.get("diam_mm") or h.get("diameter") or h.get("diameter_mm") or h.get("d") or 0.0
+                for h in holes
+            ),
+            dtype=np.float64,
+            count=n,
+        )
+    except (TypeError, ValueError):
+        return None
+    mask = d > 0
+    return list(zip(x[mask].tolist(), y[mask].tolist(), d[mask].tolist()))
+
+
+def _parse_hole_array(arr: np.ndarray) -> List[Tuple[float, float, float]]:
+    """Array (N, >=3) de [x, y, d]: filtrado vectorizado, mismo criterio que el bucle (d > 0)."""
+    try:
+        a = np.asarray(arr, dtype=np.float64)
+    except (TypeError, ValueError):
+        return []
+    if a.ndim != 2 or a.shape[1] < 3:
+        return []
+    a = a[:, :3]
+    # sin filtro de finitud: el bucle general tampoco lo aplica (un d NaN
+    # cae solo con d > 0; x/y no finitos se conservan)
+    a = a[a[:, 2] > 0]
+    return list(zip(a[:, 0].tolist(), a[:, 1].tolist(), a[:, 2].tolist()))
+
+
+def _parse_hole_rows_np(holes: Sequence[Any]) -> Optional[List[Tuple[float, float, float]]]:
+    """Listas grandes de tuplas [x, y, d] numéricas de una sola pasada; None si no encajan."""
+    if not all(type(h) in (list, tuple) for h in holes):
+        return None
+    try:
+        a = np.asarray(holes, dtype=np.float64)
+    except (TypeError, ValueError):
+        return None
+    if a.ndim != 2 or a.shape[1] < 3:
+        return None
+    return _parse_hole_array(a)
+
+
 # ---------------------- Primitivas ----------------------
 
+# Flecha máxima (mm) por defecto entre cada arco y su cuerda al facetar
+# círculos y cilindros (la misma que SIMPLIFY_TOL en utils_geo).
+CHORD_TOL = 0.05
+
+
+def sections_for(
+    radius: Union[float, np.ndarray],
+    tol: float = CHORD_TOL,
+    lo: int = 16,
+    hi: int = 128,
+) -> Union[int, np.ndarray]:
+    """
+    Nº de lados de un círculo de radio `radius` para que la flecha de cada
+    cuerda no pase de `tol`, acotado a [lo, hi]. Regla única para cilindros,
+    taladros y contornos 2D; con un ndarray de radios devuelve un array.
+    """
+    r = np.maximum(np.asarray(radius, dtype=np.float64), tol)
+    with np.errstate(divide="ignore"):
+        n = np.ceil(np.pi / np.arccos(1.0 - tol / r))  # radio infinito -> hi
+    n = np.clip(n, lo, hi).astype(np.int64)
+    return int(n) if n.ndim == 0 else n
+
+
+# Plantillas unitarias: se triangulan una vez y cada pieza es un simple
+# escalado de vértices (sin volver a generar la malla en Python).
+
+@lru_cache(maxsize=1)
+def _unit_box() -> trimesh.Trimesh:
+    return trimesh.creation.box(extents=(1.0, 1.0, 1.0))
+
+
+@lru_cache(maxsize=32)
+def _unit_cylinder(sections: int) -> trimesh.Trimesh:
+    return trimesh.creation.cylinder(radius=1.0, height=1.0, sections=sections)
+
+
+def _scaled(tpl: trimesh.Trimesh, scale: Sequence[float]) -> trimesh.Trimesh:
+    return trimesh.Trimesh(
+        vertices=tpl.vertices.view(np.ndarray) * np.asarray(scale, dtype=float),
+        faces=tpl.faces.view(np.ndarray).copy(),
+        process=False,
+    )
+
+
 def box(extents: Sequence[float]) -> trimesh.Trimesh:
     """Caja centrada en el origen. `extents=(L, W, T)` en mm."""
-    return trimesh.creation.box(extents=np.asarray(extents, dtype=float))
+    return _scaled(_unit_box(), extents)
 
 
 def cylinder(radius: float, height: float, sections: int = 64) -> trimesh.Trimesh:
@@ -70,7 +203,238 @@ def cylinder(radius: float, height: float, sections: int = 64) -> trimesh.Trimes
     r = float(radius)
     h = float(height)
     s = int(sections) if sections and sections > 3 else 32
-    return trimesh.creation.cylinder(radius=r, height=h, sections=s)
+    return _scaled(_unit_cylinder(s), (r, r, h))
+
+
+def _open_box_faces() -> np.ndarray:
+    # Anillos de 4 vértices (antihorario visto desde +Z): 0 fondo exterior,
+    # 4 boca exterior, 8 boca interior, 12 suelo interior.
+    def walls(lo: int, up: int, inward: bool = False) -> List[Tuple[int, int, int, int]]:
+        out = []
+        for i in range(4):
+            j = (i + 1) % 4
+            q = (lo + i, lo + j, up + j, up + i)
+            out.append(q[::-1] if inward else q)
+        return out
+
+    quads = [(0, 3, 2, 1)]                     # fondo (normal -Z)
+    quads += walls(0, 4)                       # paredes exteriores
+    quads += walls(4, 8)                       # borde superior (normal +Z)
+    quads += walls(12, 8, inward=True)         # paredes interiores (hacia el hueco)
+    quads += [(12, 13, 14, 15)]                # suelo interior (normal +Z)
+    q = np.array(quads, dtype=np.int64)
+    F = np.concatenate([q[:, [0, 1, 2]], q[:, [0, 2, 3]]])
+    F.setflags(write=False)
+    return F
+
+
+_OPEN_BOX_F = _open_box_faces()
+
+
+def open_box(lo: Sequence[float], hi: Sequence[float],
+             inner_lo: Sequence[float], inner_hi: Sequence[float]) -> trimesh.Trimesh:
+    """
+    Caja abierta por arriba como una sola malla cerrada: lo mismo que la caja
+    [lo, hi] menos el hueco [inner_lo, inner_hi] cuando este sale por la tapa,
+    pero sin booleano ni caras internas (16 vértices, 28 triángulos).
+    `inner_lo[2]` es la cota del suelo interior; la z de `inner_hi` se ignora.
+    """
+    x0, y0, z0 = (float(v) for v in lo)
+    x1, y1, z1 = (float(v) for v in hi)
+    a0, b0, zf = (float(v) for v in inner_lo)
+    a1, b1 = float(inner_hi[0]), float(inner_hi[1])
+    V = np.array([
+        (x0, y0, z0), (x1, y0, z0), (x1, y1, z0), (x0, y1, z0),
+        (x0, y0, z1), (x1, y0, z1), (x1, y1, z1), (x0, y1, z1),
+        (a0, b0, z1), (a1, b0, z1), (a1, b1, z1), (a0, b1, z1),
+        (a0, b0, zf), (a1, b0, zf), (a1, b1, zf), (a0, b1, zf),
+    ])
+    return trimesh.Trimesh(vertices=V, faces=_OPEN_BOX_F.copy(), process=False)
+
+
+# ---------------------- Primitivas "en crudo" ----------------------
+# Para ensamblados sin booleanos: arrays (V, F) sin objeto Trimesh intermedio
+# (ni caché, ni TrackedArray, ni visuales). Se envuelven una sola vez al final.
+
+Prim = namedtuple("Prim", "V F")
+
+
+def _apply_affine_inplace(V: np.ndarray, M: np.ndarray) -> np.ndarray:
+    """
+    Aplica la afín 4x4 `M` a los vértices `V` (N, 3) sobre el propio array,
+    sin pasar por Trimesh.apply_transform (ni cachés que invalidar).
+    `V` debe ser un array propio y escribible.
+    """
+    M = np.asarray(M, dtype=np.float64)
+    V[:] = V @ M[:3, :3].T
+    V += M[:3, 3]
+    return V
+
+
+def box_prim(extents: Sequence[float], offset: Sequence[float] = (0.0, 0.0, 0.0)) -> Prim:
+    """Caja centrada en `offset` como arrays crudos (plantilla unitaria escalada)."""
+    tpl = _unit_box()
+    # .view(np.ndarray): operar sobre arrays planos, no sobre TrackedArray
+    V = tpl.vertices.view(np.ndarray) * np.asarray(extents, dtype=np.float64) + np.asarray(offset, dtype=np.float64)
+    return Prim(V, tpl.faces.view(np.ndarray))
+
+
+@lru_cache(maxsize=32)
+def _boxes_faces(n: int) -> np.ndarray:
+    """Tabla de caras de `n` cajas unitarias seguidas (solo lectura, compartida)."""
+    bf = np.asarray(_unit_box().faces, dtype=np.int64)
+    F = (bf[None, :, :] + len(_unit_box().vertices) * np.arange(n)[:, None, None]).reshape(-1, 3)
+    F.setflags(write=False)
+    return F
+
+
+def assemble_boxes(specs: Sequence[Tuple[Sequence[float], Sequence[float]]]) -> trimesh.Trimesh:
+    """
+    Ensamblado de `specs = [(extents, offset), ...]` cajas en un único Trimesh.
+    La topología (caras) de n cajas se cachea; por petición solo se evalúan
+    los vértices, todos de una vez: V = V_unidad * extents + offset.
+    """
+    n = len(specs)
+    if not n:
+        return trimesh.Trimesh()
+    bv = _unit_box().vertices.view(np.ndarray)
+    ext = np.array([e for e, _ in specs], dtype=np.float64)
+    off = np.array([o for _, o in specs], dtype=np.float64)
+    V = (bv[None, :, :] * ext[:, None, :] + off[:, None, :]).reshape(-1, 3)
+    return trimesh.Trimesh(vertices=V, faces=_boxes_faces(n).copy(), process=False)
+
+
+def cyl_prim(
+    radius: float,
+    height: float,
+    sections: Optional[int] = None,
+    transform: Optional[np.ndarray] = None,
+    offset: Sequence[float] = (0.0, 0.0, 0.0),
+) -> Prim:
+    """Cilindro (eje Z) como arrays crudos; `transform` 4x4 opcional y luego `offset`."""
+    r = float(radius)
+    tpl = _unit_cylinder(int(sections) if sections else sections_for(r))
+    V = tpl.vertices.view(np.ndarray) * np.array((r, r, float(height)))
+    if transform is not None:
+        _apply_affine_inplace(V, transform)
+    V += np.asarray(offset, dtype=np.float64)
+    return Prim(V, tpl.faces.view(np.ndarray))
+
+
+def prims_to_mesh(prims: Iterable[Prim]) -> trimesh.Trimesh:
+    """Un único Trimesh (process=False) a partir de varias primitivas crudas."""
+    Vs: List[np.ndarray] = []
+    Fs: List[np.ndarray] = []
+    n = 0
+    for p in prims:
+        Vs.append(p.V)
+        Fs.append(p.F + n)
+        n += len(p.V)
+    if not Vs:
+        return trimesh.Trimesh()
+    return trimesh.Trimesh(vertices=np.vstack(Vs), faces=np.vstack(Fs), process=False)
+
+
+@lru_cache(maxsize=64)
+def _rotation(angle: float, axis: Tuple[float, float, float]) -> np.ndarray:
+    M = trimesh.transformations.rotation_matrix(angle, axis)
+    M.setflags(write=False)  # compartida entre llamadas: solo lectura
+    return M
+
+
+def rotation(angle: float, axis: Sequence[float]) -> np.ndarray:
+    """Matriz 4x4 de rotación (radianes), cacheada por ángulo/eje redondeados."""
+    return _rotation(round(float(angle), 12), tuple(round(float(a), 12) for a in axis))
+
+
+def translate(mesh: trimesh.Trimesh, offset: Sequence[float]) -> trimesh.Trimesh:
+    """
+    Traslación pura sumando directamente sobre los vértices (sin construir una
+    matriz 4x4 ni multiplicar). Modifica `mesh` y lo devuelve.
+    """
+    mesh.vertices += np.asarray(offset, dtype=np.float64)
+    return mesh
+
+
+class MeshBuilder:
+    """
+    Ensambla piezas sin booleanos acumulando vértices y caras en listas de
+    arrays y crea un único Trimesh al final: los buffers se reservan una vez
+    con el tamaño total y el desplazamiento de índices se aplica al copiar
+    las caras. La misma plantilla puede añadirse varias veces con distinta
+    transformación sin copiarla.
+    """
+
+    def __init__(self) -> None:
+        self._v: List[np.ndarray] = []
+        self._f: List[np.ndarray] = []
+        self._n = 0
+
+    def add(
+        self,
+        mesh: trimesh.Trimesh,
+        transform: Optional[np.ndarray] = None,
+        offset: Optional[Sequence[float]] = None,
+    ) -> "MeshBuilder":
+        """Añade `mesh` aplicando `transform` (4x4) y/o `offset` solo a la copia que se guarda."""
+        v = np.asarray(mesh.vertices, dtype=np.float64)
+        if transform is not None:
+            v = _apply_affine_inplace(np.array(v), transform)
+            if offset is not None:
+                v += np.asarray(offset, dtype=np.float64)
+        elif offset is not None:
+            v = v + np.asarray(offset, dtype=np.float64)
+        self._v.append(v)
+        self._f.append(np.asarray(mesh.faces, dtype=np.int64))
+        self._n += len(v)
+        return self
+
+    def add_box(
+        self,
+        extents: Sequence[float],
+        offset: Sequence[float] = (0.0, 0.0, 0.0),
+        flip: bool = False,
+        transform: Optional[np.ndarray] = None,
+    ) -> "MeshBuilder":
+        """
+        Caja centrada en `offset` directamente desde la plantilla unitaria, sin
+        Trimesh intermedio. `flip=True` invierte las caras (normales hacia
+        dentro): una caja así, contenida en otra, es su hueco interior.
+        `transform` (4x4, rígida) se aplica después, sobre los propios arrays.
+        """
+        V, F = box_prim(extents, offset)
+        if transform is not None:
+            _apply_affine_inplace(V, transform)
+        if flip:
+            F = F[:, ::-1]
+        self._v.append(V)
+        self._f.append(F)
+        self._n += len(V)
+        return self
+
+    def build(self) -> trimesh.Trimesh:
+        if not self._v:
+            return trimesh.Trimesh()
+        V = np.empty((self._n, 3), dtype=np.float64)
+        F = np.empty((sum(len(f) for f in self._f), 3), dtype=np.int64)
+        iv = jf = 0
+        for v, f in zip(self._v, self._f):
+            V[iv:iv + len(v)] = v
+            np.add(f, iv, out=F[jf:jf + len(f)])
+            iv += len(v)
+            jf += len(f)
+        return trimesh.Trimesh(vertices=V, faces=F, process=False)
+
+
+def fast_concat(meshes: Iterable[trimesh.Trimesh]) -> trimesh.Trimesh:
+    """
+    Concatenación simple (vstack de vértices + caras desplazadas), sin el
+    procesado ni la fusión de atributos/visuales de trimesh.util.concatenate.
+    """
+    mb = MeshBuilder()
+    for m in meshes:
+        mb.add(m)
+    return mb.build()
 
 
 # ---------------------- Reparación y saneado ----------------------
@@ -92,6 +456,13 @@ def _repair(mesh: trimesh.Trimesh) -> trimesh.Trimesh:
     except Exception:
         pass
 
+    try:
+        # une vértices coincidentes antes que nada: una "sopa" de triángulos
+        # sin fusionar no es estanca aunque la superficie esté cerrada
+        m.merge_vertices()
+    except Exception:
+        pass
+
     try:
         m.remove_unreferenced_vertices()
     except Exception:
@@ -109,12 +480,21 @@ def _repair(mesh: trimesh.Trimesh) -> trimesh.Trimesh:
     except Exception:
         pass
 
+    return m
+
+
+def _as_volume(mesh: trimesh.Trimesh) -> trimesh.Trimesh:
+    """
+    Entrada de un booleano: las piezas ya sanas (volumen cerrado, p. ej. las
+    primitivas o un ensamblado disjunto de ellas) pasan tal cual; solo se
+    repara (copia + merge/normales/huecos) lo que no lo es.
+    """
     try:
-        m.merge_vertices()  # une vértices coincidentes
+        if mesh.is_volume:
+            return mesh
     except Exception:
         pass
-
-    return m
+    return _repair(mesh)
 
 
 # ---------------------- Manifold3D bridges ----------------------
@@ -124,40 +504,92 @@ def _to_mf(mesh: trimesh.Trimesh):
         return None
     try:
         v = np.asarray(mesh.vertices, dtype=np.float32)
-        f = np.asarray(mesh.faces, dtype=np.int32)
-        if v.size == 0 or f.size == 0:
+        if v.size == 0 or len(mesh.faces) == 0:
             return None
+        if hasattr(m3d.Manifold, "to_mesh"):
+            # manifold3d >= 2.x (API snake_case): una entrada inválida no lanza,
+            # deja el Manifold vacío con status de error
+            mf = m3d.Manifold(mesh=m3d.Mesh(
+                vert_properties=v, tri_verts=np.asarray(mesh.faces, dtype=np.uint32)))
+            return mf if mf.status() == m3d.Error.NoError else None
+        f = np.asarray(mesh.faces, dtype=np.int32)
         return m3d.Manifold.FromMesh(m3d.Mesh(v, f))  # type: ignore[attr-defined]
     except Exception:
         return None
 
 
-def _from_mf(manifold_obj) -> Optional[trimesh.Trimesh]:
+def _mf_to_trimesh(manifold_obj) -> Optional[trimesh.Trimesh]:
+    """Malla de un Manifold tal cual: ya es un volumen cerrado, sin reparar."""
     if manifold_obj is None:
         return None
     try:
-        mmesh = manifold_obj.ToMesh()
-        v = np.asarray(mmesh.vert, dtype=float)
-        f = np.asarray(mmesh.tri, dtype=np.int64)
+        if hasattr(manifold_obj, "to_mesh"):
+            mmesh = manifold_obj.to_mesh()
+            v, f = mmesh.vert_properties[:, :3], mmesh.tri_verts
+        else:
+            mmesh = manifold_obj.ToMesh()
+            v, f = mmesh.vert, mmesh.tri
+        v = np.asarray(v, dtype=float)
+        f = np.asarray(f, dtype=np.int64)
         if v.size == 0 or f.size == 0:
             return None
-        out = trimesh.Trimesh(vertices=v, faces=f, process=False)
-        return _repair(out)
+        return trimesh.Trimesh(vertices=v, faces=f, process=False)
     except Exception:
         return None
 
 
+def _from_mf(manifold_obj) -> Optional[trimesh.Trimesh]:
+    out = _mf_to_trimesh(manifold_obj)
+    return _repair(out) if out is not None else None
+
+
 # ---------------------- Booleanos robustos ----------------------
 
+def _resolve_bool_engine() -> Optional[str]:
+    """Motor de trimesh.boolean, elegido una sola vez al importar."""
+    # manifold3d corre en proceso: sin subprocesos ni ficheros temporales
+    if importlib.util.find_spec("manifold3d") is not None:
+        return "manifold"
+    blender = getattr(trimesh.interfaces, "blender", None)
+    if blender is not None and getattr(blender, "exists", False):
+        return "blender"
+    return None
+
+
+_BOOL_ENGINE: Optional[str] = _resolve_bool_engine()
+# Orden de motores para trimesh.boolean; None = el que elija trimesh.
+_BOOL_ENGINES: Tuple[Optional[str], ...] = tuple(dict.fromkeys((_BOOL_ENGINE, None)))
+
+
+def mesh_difference(base: trimesh.Trimesh, cutters: Iterable[trimesh.Trimesh]) -> trimesh.Trimesh:
+    """
+    `base` menos todos los `cutters` con trimesh.boolean (los cortadores se
+    unen antes: la diferencia de trimesh solo admite dos mallas).
+    Si ningún motor funciona, devuelve `base` sin cortar.
+    """
+    cut = [c for c in cutters if isinstance(c, trimesh.Trimesh)]
+    if not cut:
+        return base
+    for engine in _BOOL_ENGINES:
+        try:
+            tool = cut[0] if len(cut) == 1 else trimesh.boolean.union(cut, engine=engine)
+            out = trimesh.boolean.difference([base, tool], engine=engine)
+        except Exception:
+            continue
+        if isinstance(out, trimesh.Trimesh) and len(out.faces):
+            return out
+    return base
+
+
 def _concat(meshes: Iterable[trimesh.Trimesh]) -> trimesh.Trimesh:
     lst = [m for m in meshes if isinstance(m, trimesh.Trimesh) and len(m.vertices)]
     if not lst:
         return trimesh.Trimesh()
-    return trimesh.util.concatenate(lst)
+    return fast_concat(lst)
 
 
 def union(meshes: Iterable[trimesh.Trimesh]) -> trimesh.Trimesh:
-    mlist = [_repair(m) for m in (meshes or []) if isinstance(m, trimesh.Trimesh)]
+    mlist = [_as_volume(m) for m in (meshes or []) if isinstance(m, trimesh.Trimesh)]
     if not mlist:
         return trimesh.Trimesh()
 
@@ -174,14 +606,14 @@ def union(meshes: Iterable[trimesh.Trimesh]) -> trimesh.Trimesh:
             if acc is not None:
                 out = _from_mf(acc)
                 if isinstance(out, trimesh.Trimesh):
-                    return _repair(out)
+                    return out  # _from_mf ya la repara
         except Exception:
             pass
 
     # B) Fallback: trimesh.boolean
     try:
         from trimesh.boolean import union as _u
-        res = _u(mlist, engine=None)
+        res = _u(mlist, engine=_BOOL_ENGINE)
         if isinstance(res, trimesh.Trimesh):
             return _repair(res)
     except Exception:
@@ -192,14 +624,14 @@ def union(meshes: Iterable[trimesh.Trimesh]) -> trimesh.Trimesh:
 
 
 def difference(a: trimesh.Trimesh, b: Iterable[trimesh.Trimesh] | trimesh.Trimesh) -> trimesh.Trimesh:
-    A = _repair(a)
+    A = _as_volume(a) if isinstance(a, trimesh.Trimesh) else a
     Blist = []
     if isinstance(b, (list, tuple)):
-        Blist = [_repair(x) for x in b if isinstance(x, trimesh.Trimesh)]
+        Blist = [_as_volume(x) for x in b if isinstance(x, trimesh.Trimesh)]
     elif isinstance(b, trimesh.Trimesh):
-        Blist = [_repair(b)]
+        Blist = [_as_volume(b)]
     if not isinstance(A, trimesh.Trimesh) or not Blist:
-        return A if isinstance(A, trimesh.Trimesh) else trimesh.Trimesh()
+        return A.copy() if isinstance(A, trimesh.Trimesh) else trimesh.Trimesh()
 
     # A) Manifold3D
     if _HAS_MF:
@@ -216,25 +648,25 @@ def difference(a: trimesh.Trimesh, b: Iterable[trimesh.Trimesh] | trimesh.Trimes
                 if mB is not None:
                     out = _from_mf(mA - mB)
                     if isinstance(out, trimesh.Trimesh):
-                        return _repair(out)
+                        return out  # _from_mf ya la repara
         except Exception:
             pass
 
     # B) Fallback: trimesh.boolean
     try:
         from trimesh.boolean import difference as _d
-        res = _d([A], Blist, engine=None)
+        res = _d([A], Blist, engine=_BOOL_ENGINE)
         if isinstance(res, trimesh.Trimesh):
             return _repair(res)
     except Exception:
         pass
 
-    # C) si falla, devolvemos A sin cortar (mejor que romper)
-    return A
+    # C) si falla, devolvemos A sin cortar (mejor que romper), nunca la entrada
+    return A.copy() if A is a else A
 
 
 def intersection(meshes: Iterable[trimesh.Trimesh]) -> trimesh.Trimesh:
-    mlist = [_repair(m) for m in (meshes or []) if isinstance(m, trimesh.Trimesh)]
+    mlist = [_as_volume(m) for m in (meshes or []) if isinstance(m, trimesh.Trimesh)]
     if len(mlist) < 2:
         return mlist[0] if mlist else trimesh.Trimesh()
 
@@ -251,14 +683,14 @@ def intersection(meshes: Iterable[trimesh.Trimesh]) -> trimesh.Trimesh:
             if acc is not None:
                 out = _from_mf(acc)
                 if isinstance(out, trimesh.Trimesh):
-                    return _repair(out)
+                    return out  # _from_mf ya la repara
         except Exception:
             pass
 
     # B) Fallback: trimesh.boolean
     try:
         from trimesh.boolean import intersection as _i
-        res = _i(mlist, engine=None)
+        res = _i(mlist, engine=_BOOL_ENGINE)
         if isinstance(res, trimesh.Trimesh):
             return _repair(res)
     except Exception:
@@ -268,26 +700,74 @@ def intersection(meshes: Iterable[trimesh.Trimesh]) -> trimesh.Trimesh:
     return trimesh.Trimesh()
 
 
+# ---------------------- Caché de construcciones ----------------------
+
+def _freeze(v: Any) -> Any:
+    """Versión hashable de un valor de parámetros (listas/dicts anidados)."""
+    if isinstance(v, dict):
+        return tuple(sorted((str(k), _freeze(x)) for k, x in v.items()))
+    if isinstance(v, (list, tuple)):
+        return tuple(_freeze(x) for x in v)
+    return v
+
+
+def params_key(params: Optional[Dict[str, Any]]) -> Tuple[Any, ...]:
+    """Clave canónica (independiente del orden) de un dict de parámetros."""
+    return _freeze(params or {})
+
+
+def memo_build(maxsize: int = 128) -> Callable:
+    """
+    Decorador para `make_model(params)`: guarda las últimas `maxsize` mallas por
+    parámetros canónicos y devuelve siempre una copia (la cacheada no se toca).
+    Si los parámetros no son hashables, construye sin caché.
+    """
+    def deco(fn: Callable[[Dict[str, Any]], trimesh.Trimesh]) -> Callable:
+        cache: "OrderedDict[Any, trimesh.Trimesh]" = OrderedDict()
+        lock = threading.Lock()
+
+        @wraps(fn)
+        def wrapper(params: Dict[str, Any]) -> trimesh.Trimesh:
+            try:
+                key = params_key(params)
+                hash(key)
+            except TypeError:
+                return fn(params)
+            with lock:
+                hit = cache.get(key)
+                if hit is not None:
+                    cache.move_to_end(key)
+                    return hit.copy()
+            mesh = fn(params)
+            if not isinstance(mesh, trimesh.Trimesh):
+                return mesh
+            with lock:
+                cache[key] = mesh
+                if len(cache) > maxsize:
+                    cache.popitem(last=False)
+            return mesh.copy()
+
+        wrapper.cache_clear = cache.clear  # type: ignore[attr-defined]
+        return wrapper
+    return deco
+
+
 # ---------------------- Helpers de modelo ----------------------
 
 def plate_with_holes(L: float, W: float, T: float, holes: List[Tuple[float, float, float]]) -> trimesh.Trimesh:
     """
     Crea una placa LxW de espesor T centrada en el origen, con taladros en (x,y,diam).
-    El eje Z es la altura, por lo que los cilindros se orientan sobre Z.
+    El eje Z es la altura. Los taladros se recortan en 2D y se extruye el
+    perfil resultante: sin booleanos 3D.
     """
-    base = box((L, W, T))
     if not holes:
-        return _repair(base)
-
-    cutters = []
-    hcut = T * 1.6  # un poco más alto que la placa para asegurar corte
-    for (x, y, d) in holes:
-        r = float(d) * 0.5
-        c = cylinder(r, hcut, sections=64)
-        # por defecto, cilindro centrado en z=0. La placa también: perfecto
-        c.apply_translation((float(x), float(y), 0.0))
-        cutters.append(c)
-
-    if len(cutters) == 1:
-        return difference(base, cutters[0])
-    return difference(base, union(cutters))
+        return box((L, W, T))  # caja recién creada: ya es estanca
+
+    # import diferido: utils_geo depende de este módulo
+    import shapely.geometry as sg
+    from shapely.ops import unary_union
+    from .utils_geo import circle, extrude_centered
+
+    outer = sg.box(-L / 2.0, -W / 2.0, L / 2.0, W / 2.0)
+    cuts = unary_union([circle(float(x), float(y), float(d)) for (x, y, d) in holes])
+    return extrude_centered(outer.difference(cuts), T)
@@ -1,8 +1,13 @@
 # apps/stl-service/models/cable_tray.py
-from typing import Dict, Any
+from collections import namedtuple
+from functools import lru_cache
+from typing import Dict, Any, Iterable, List, Tuple
+import numpy as np
+import shapely.geometry as sg
 import trimesh
-from ._helpers import parse_holes
-from .utils_geo import rectangle_plate, plate_with_holes, concatenate
+from shapely.ops import unary_union
+from ._helpers import MeshBuilder, box_prim, parse_holes, prims_to_mesh, translate
+from .utils_geo import extrude_polygons, rectangle_plate, plate_with_holes
 
 NAME = "cable_tray"
 
@@ -24,18 +29,68 @@ DEFAULTS = {
     "holes": [],  # (x,y,d) relativo al lateral (placa vertical)
 }
 
+# Extrusión (u, v, w) -> (x=w, y=u, z=v): perfil en el plano YZ, longitud en X
+_YZ_TO_X = np.array([
+    [0.0, 0.0, 1.0, 0.0],
+    [1.0, 0.0, 0.0, 0.0],
+    [0.0, 1.0, 0.0, 0.0],
+    [0.0, 0.0, 0.0, 1.0],
+])
+
+# Parámetros ya normalizados (hashables): sirven de clave para la caché de mallas.
+Params = namedtuple("Params", "W H L T ventilated holes_key")
+
+
+def _get(p: Dict[str, Any], keys: Iterable[str], default: float) -> float:
+    """Primer valor presente entre `keys` (acepta alias `*_mm`), como float."""
+    for k in keys:
+        v = p.get(k)
+        if v is not None:
+            return float(v)
+    return float(default)
+
+
+def _coerce(params: Dict[str, Any]) -> Params:
+    """Lee y valida los parámetros una sola vez."""
+    holes: Tuple[Tuple[float, float, float], ...] = tuple(parse_holes(params.get("holes") or []))
+    return Params(
+        W=_get(params, ("width", "width_mm"), DEFAULTS["width"]),
+        H=_get(params, ("height", "height_mm"), DEFAULTS["height"]),
+        L=_get(params, ("length", "length_mm"), DEFAULTS["length"]),
+        T=_get(params, ("thickness", "thickness_mm"), DEFAULTS["thickness"]),
+        ventilated=bool(params.get("ventilated", DEFAULTS["ventilated"])),
+        holes_key=holes,
+    )
+
+
 def make_model(params: Dict[str, Any]) -> trimesh.Trimesh:
-    W = float(params.get("width", DEFAULTS["width"]))
-    H = float(params.get("height", DEFAULTS["height"]))
-    L = float(params.get("length", DEFAULTS["length"]))
-    T = float(params.get("thickness", DEFAULTS["thickness"]))
-    holes = parse_holes(params.get("holes", []))
-    ventilated = bool(params.get("ventilated", DEFAULTS["ventilated"]))
+    # La malla cacheada no se entrega nunca: cada petición recibe su copia.
+    return _build(_coerce(params)).copy()
+
+
+@lru_cache(maxsize=64)
+def _build(p: Params) -> trimesh.Trimesh:
+    W, H, L, T = p.W, p.H, p.L, p.T
+    holes = list(p.holes_key)
+    ventilated = p.ventilated
+
+    # Caso por defecto más simple (sin ventanas ni agujeros): tres cajas directas
+    if not ventilated and not holes:
+        return _fast_tray(L, H, W, T)
+
+    mb = MeshBuilder()
+    # Secciones (plano YZ) de las piezas lisas, que se extruyen juntas a lo largo de X
+    profile: List[sg.Polygon] = []
 
     # Dos laterales (placas verticales) + base inferior (placa horizontal).
-    left = rectangle_plate(L, H, T, holes)              # lateral izquierdo
-    right = rectangle_plate(L, H, T, holes)             # reutilizamos mismos agujeros
-    right.apply_translation((0, 0, W))                  # separarlo por el ancho
+    if holes:
+        # Ambos laterales comparten la misma plantilla (un solo taladrado).
+        side = rectangle_plate(L, H, T, holes)
+        mb.add(side)                                    # lateral izquierdo
+        mb.add(side, offset=(0, 0, W))                  # lateral derecho, separado por el ancho
+    else:
+        profile.append(sg.box(T / 2.0, 0.0, H + T / 2.0, T))
+        profile.append(sg.box(T / 2.0, W, H + T / 2.0, W + T))
 
     # Base: placa horizontal con posibles ranuras “simuladas” como agujeros grandes (opcional)
     base_holes = []
@@ -43,13 +98,28 @@ def make_model(params: Dict[str, Any]) -> trimesh.Trimesh:
         # Colocamos “ventanas” circulares a lo largo del centro solo para alivianar.
         n = max(1, int(L // 30))
         step = L / (n + 1)
-        x0 = -L / 2.0 + step
-        for i in range(n):
-            base_holes.append((x0 + i * step, 0.0, min(8.0, W * 0.5)))
+        xs = -L / 2.0 + step * np.arange(1, n + 1, dtype=np.float64)
+        pts = np.column_stack([xs, np.zeros(n), np.full(n, min(8.0, W * 0.5))])
+        base_holes = [tuple(h) for h in pts.tolist()]
+
+    if base_holes:
+        base = plate_with_holes(L, W, T, base_holes)
+        translate(base, (0, 0, W / 2.0))                # centrar en Z entre los laterales
+        mb.add(base)
+    else:
+        profile.append(sg.box(-W / 2.0 + T / 2.0, W / 2.0, W / 2.0 + T / 2.0, W / 2.0 + T))
+
+    # Una sola extrusión para todas las piezas lisas
+    if profile:
+        mb.add(extrude_polygons(unary_union(profile), L), transform=_YZ_TO_X, offset=(-L / 2.0, 0, 0))
+    return mb.build()
+
 
-    base = plate_with_holes(L, W, T, base_holes)
-    base.apply_translation((0, 0, W / 2.0))             # centrar en Z entre los laterales
+def _fast_tray(L: float, H: float, W: float, T: float) -> trimesh.Trimesh:
+    """Laterales + base lisos como arrays crudos: sin shapely ni triangulación."""
+    return prims_to_mesh([
+        box_prim((L, H, T), offset=(0, H / 2.0 + T / 2.0, T / 2.0)),       # lateral izquierdo
+        box_prim((L, H, T), offset=(0, H / 2.0 + T / 2.0, W + T / 2.0)),   # lateral derecho
+        box_prim((L, W, T), offset=(0, T / 2.0, W / 2.0 + T / 2.0)),       # base
+    ])
 
-    # Ensamblado
-    tray = concatenate([left, right, base])
-    return tray
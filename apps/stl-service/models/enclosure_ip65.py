@@ -2,6 +2,8 @@
 from typing import Dict, Any
 import trimesh
 
+from ._helpers import box, translate
+
 NAME = "enclosure_ip65"
 
 TYPES = {
@@ -25,6 +27,4 @@ def make_model(params: Dict[str, Any]) -> trimesh.Trimesh:
     W = float(params.get("width", DEFAULTS["width"]))
     H = float(params.get("height", DEFAULTS["height"]))
     # Caja sólida estable (sin CSG), apoyada en Y=0
-    box = trimesh.creation.box(extents=(L, H, W))
-    box.apply_translation((0, H / 2.0, 0))
-    return box
+    return translate(box((L, H, W)), (0, H / 2.0, 0))
@@ -2,7 +2,7 @@
 from dataclasses import dataclass
 from typing import Any, Iterable
 
-@dataclass
+@dataclass(slots=True)
 class Vec:
     x: float = 0.0
     y: float = 0.0
@@ -12,14 +12,31 @@ class Vec:
     def __iter__(self): yield from (self.x, self.y, self.z)
     # operadores
     def __neg__(self):       return Vec(-self.x, -self.y, -self.z)
-    def __add__(self, o):    o = vec3(o); return Vec(self.x+o.x, self.y+o.y, self.z+o.z)
-    def __sub__(self, o):    o = vec3(o); return Vec(self.x-o.x, self.y-o.y, self.z-o.z)
+    # Vec ± Vec (caso habitual) sin pasar por vec3()
+    def __add__(self, o):
+        if type(o) is not Vec:
+            o = vec3(o)
+        return Vec(self.x+o.x, self.y+o.y, self.z+o.z)
+    def __sub__(self, o):
+        if type(o) is not Vec:
+            o = vec3(o)
+        return Vec(self.x-o.x, self.y-o.y, self.z-o.z)
     def __mul__(self, s: float):  return Vec(self.x*s, self.y*s, self.z*s)
     def __rmul__(self, s: float): return self.__mul__(s)
     def __truediv__(self, s: float): return Vec(self.x/s, self.y/s, self.z/s)
 
+def vec3_from_tuple(t: tuple) -> Vec:
+    """Camino rápido para tuplas (x, y, z) numéricas."""
+    return Vec(float(t[0]), float(t[1]), float(t[2]))
+
 def vec3(obj: Any) -> Vec:
     """Convierte dict/tuple/list/Vec a Vec; tolera {x,y,z} o {x_mm,z_mm}."""
+    # casos habituales primero, por tipo exacto (sin cadena de isinstance)
+    t = type(obj)
+    if t is Vec:
+        return obj
+    if t is tuple and len(obj) == 3:
+        return vec3_from_tuple(obj)
     if isinstance(obj, Vec):
         return obj
     if isinstance(obj, dict):
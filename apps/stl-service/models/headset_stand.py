@@ -3,12 +3,14 @@ from typing import Dict, Any, List, Tuple
 import math
 import numpy as np
 import trimesh
-from trimesh.creation import box, cylinder
 from .utils_geo import plate_with_holes, rectangle_plate, concatenate
-from ._helpers import parse_holes
+from ._helpers import box_prim, cyl_prim, parse_holes, prims_to_mesh, rotation, translate
 
 NAME = "headset_stand"
 
+# columnas del yoke: eje Z del cilindro -> eje Y
+_ROT_X90 = rotation(math.pi/2, (1, 0, 0))
+
 # Usamos el contrato genérico: length_mm, width_mm, height_mm, thickness_mm, fillet_mm
 DEFAULTS: Dict[str, float] = {
     "length_mm": 120.0,   # largo de la base (X)
@@ -36,20 +38,13 @@ def _u_yoke(inner_radius: float, width: float, thickness: float) -> trimesh.Trim
     w = width
     t = thickness
 
-    # dos columnas (cilindros) a cada lado
-    col = cylinder(radius=t/2.0, height=w, sections=64)
-    col.apply_rotation(trimesh.transformations.rotation_matrix(math.pi/2, [1,0,0]))
-    c1 = col.copy(); c1.apply_translation((+r, 0, 0))
-    c2 = col.copy(); c2.apply_translation((-r, 0, 0))
-
-    # puente superior (caja curvada aproximada con una caja)
-    bridge = box(extents=(2*r + t, t, w))
-    bridge.apply_translation((0, r, 0))
-
-    u = concatenate([c1, c2, bridge])
-    # elevar un poco para sentar sobre el mástil
-    u.apply_translation((0, 0, 0))
-    return u
+    # dos columnas (cilindros) a cada lado + puente superior (caja curvada
+    # aproximada con una caja); se ensamblan como arrays y un solo Trimesh
+    return prims_to_mesh([
+        cyl_prim(t/2.0, w, transform=_ROT_X90, offset=(+r, 0, 0)),
+        cyl_prim(t/2.0, w, transform=_ROT_X90, offset=(-r, 0, 0)),
+        box_prim((2*r + t, t, w), offset=(0, r, 0)),
+    ])
 
 def make_model(params: Dict[str, Any], holes: List[Tuple[float, float, float]] = ()) -> trimesh.Trimesh:
     L = float(params.get("length_mm", DEFAULTS["length_mm"]))
@@ -64,14 +59,14 @@ def make_model(params: Dict[str, Any], holes: List[Tuple[float, float, float]] =
 
     # Mástil: placa vertical (X por Y = altura), centrado en X, colocado en el fondo
     mast = rectangle_plate(T * 3, H, T)  # mástil delgado, 3T de ancho
-    mast.apply_translation((0, T + H/2.0, -W/2.0 + T*2))
+    translate(mast, (0, T + H/2.0, -W/2.0 + T*2))
 
     # Yoke superior: ancho ~ L*0.6, radio interior ~ L*0.25
     y_w = L * 0.6
     y_r = L * 0.25
     yoke = _u_yoke(y_r, y_w, T)
     # Colocar el yoke en la cima del mástil
-    yoke.apply_translation((0, T + H, -W/2.0 + T*2))
+    translate(yoke, (0, T + H, -W/2.0 + T*2))
 
     mesh = concatenate([base, mast, yoke])
     # Centrar en torno al origen: ya está centrado en X, adelantado en +Y (espesor)
@@ -3,24 +3,11 @@ from __future__ import annotations
 from typing import Dict, Any
 import trimesh
 
-NAME = "hub_holder"
+from ._helpers import memo_build, open_box
 
-def _bool_diff(base: trimesh.Trimesh, cutter: trimesh.Trimesh) -> trimesh.Trimesh:
-    try:
-        engine = "scad" if trimesh.interfaces.scad.exists else None
-        out = base.difference(cutter, engine=engine)
-        if isinstance(out, list):
-            return trimesh.util.concatenate(out)
-        return out or base
-    except Exception:
-        try:
-            out = trimesh.boolean.difference([base, cutter], engine="scad" if trimesh.interfaces.scad.exists else None)
-            if isinstance(out, list):
-                return trimesh.util.concatenate(out)
-            return out or base
-        except Exception:
-            return base
+NAME = "hub_holder"
 
+@memo_build()
 def make_model(params: Dict[str, Any]) -> trimesh.Trimesh:
     # UI: hub_w, hub_h, hub_d, tolerance, wall
     iw = float(params.get("hub_w", 100))
@@ -37,13 +24,9 @@ def make_model(params: Dict[str, Any]) -> trimesh.Trimesh:
     oh = ih + t
     odp = idp + t
 
-    outer = trimesh.creation.box(extents=(ow, odp, oh))
-    outer.apply_translation((0, 0, oh/2))
-
-    inner = trimesh.creation.box(extents=(iw, idp, ih))
-    inner.apply_translation((0, 0, t + ih/2))  # deja "suelo" de espesor t
-
-    return _bool_diff(outer, inner)
+    # Caja abierta por arriba como una sola malla cerrada (mismo sólido que
+    # exterior menos interior, sin booleano). El hueco interior está centrado.
+    return open_box((-ow/2, -odp/2, 0.0), (ow/2, odp/2, oh), (-iw/2, -idp/2, t), (iw/2, idp/2))
 
 def make(params: Dict[str, Any]) -> trimesh.Trimesh:
     return make_model(params)
@@ -1,17 +1,29 @@
 # apps/stl-service/models/laptop_stand.py
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Dict, Any, List, Tuple
 import math
-import shapely.geometry as sg
+import numpy as np
 import trimesh
-from trimesh.transformations import rotation_matrix
 
 from .utils_geo import plate_with_holes, rectangle_plate, concatenate
-from ._helpers import parse_holes
+from ._helpers import Prim, _apply_affine_inplace, memo_build, parse_holes, prims_to_mesh, rotation
 
 NAME = "laptop_stand"
 
+# +90º en Y: el espesor de la costilla (Z tras extruir) pasa a X
+_ROT_Y90 = rotation(math.radians(90.0), (0, 1, 0))
+
+# Caras del prisma triangular (normales hacia fuera): 2 tapas + 3 laterales
+_RIB_F = np.array([
+    [0, 1, 2], [5, 4, 3],
+    [0, 2, 5], [0, 5, 3],
+    [1, 0, 3], [1, 3, 4],
+    [2, 1, 4], [2, 4, 5],
+], dtype=np.int64)
+_RIB_F.setflags(write=False)
+
 DEFAULTS: Dict[str, float] = {
     "length_mm": 250.0,   # longitud de apoyo (X)
     "width_mm": 230.0,    # profundidad total (Z)
@@ -29,7 +41,8 @@ TYPES: Dict[str, str] = {
     "holes": "list[tuple[float,float,float]]",
 }
 
-def _rib_tri_prism(W: float, H: float, T: float) -> trimesh.Trimesh:
+@lru_cache(maxsize=64)
+def _rib_template(W: float, H: float, T: float) -> Prim:
     """
     Costilla lateral triangular:
       - Perfil en XY: (0,0) -> (0,H) -> (W, 0.6*H)
@@ -38,18 +51,38 @@ def _rib_tri_prism(W: float, H: float, T: float) -> trimesh.Trimesh:
       - Finalmente se centra en Z y en X (espesor T simétrico).
     Resultado: prism con dimensiones aprox (X: T, Y: ~H, Z: ~W).
     """
-    profile = sg.Polygon([(0.0, 0.0), (0.0, H), (W, 0.6 * H)])
-    rib = trimesh.creation.extrude_polygon(profile, T)  # extruye en +Z
+    # Prisma escrito a mano (6 vértices, 8 triángulos): sin shapely ni earcut
+    # para un perfil de 3 puntos. Tapa inferior z=0, superior z=T.
+    V = np.array([
+        [0.0, 0.0, 0.0], [0.0, H, 0.0], [W, 0.6 * H, 0.0],
+        [0.0, 0.0, T],   [0.0, H, T],   [W, 0.6 * H, T],
+    ])
+
+    # Rotar +90° en Y (el espesor, antes en Z, pasa a X) y re-centrar
+    # (espesor simétrico en X, centrada en Z) en una sola matriz.
+    M = _ROT_Y90.copy()
+    M[:3, 3] = (-T / 2.0, 0.0, -W / 2.0)
+    _apply_affine_inplace(V, M)
+
+    # Arrays de solo lectura: la plantilla cacheada no se puede alterar
+    V.setflags(write=False)
+    return Prim(V, _RIB_F)
 
-    # Rotar +90° en Y: el espesor (antes en Z) pasa a X.
-    R = rotation_matrix(math.radians(90.0), [0, 1, 0])
-    rib.apply_transform(R)
 
-    # Re-centrar: espesor simétrico en X y centrar en Z
-    rib.apply_translation((-T / 2.0, 0.0, -W / 2.0))
-    return rib
+def _ribs(L: float, W: float, H: float, T: float) -> trimesh.Trimesh:
+    """
+    Las dos costillas en un solo Trimesh: la plantilla cacheada desplazada a
+    cada lateral (x = ∓(L/2 - T/2)), sin copias intermedias de la malla.
+    """
+    tpl = _rib_template(W, H, T)
+    dx = L / 2.0 - T / 2.0
+    return prims_to_mesh([
+        Prim(tpl.V + (-dx, 0.0, 0.0), tpl.F),   # izquierda
+        Prim(tpl.V + (+dx, 0.0, 0.0), tpl.F),   # derecha
+    ])
 
 
+@memo_build()
 def make_model(params: Dict[str, Any]) -> trimesh.Trimesh:
     """
     Builder principal (firma compat con tu app: recibe SOLO un dict).
@@ -64,16 +97,7 @@ def make_model(params: Dict[str, Any]) -> trimesh.Trimesh:
     holes: List[Tuple[float, float, float]] = parse_holes(holes_in)
 
     # ---- Costillas laterales (dos triángulos extruidos) ----
-    rib0 = _rib_tri_prism(W=W, H=H, T=T)  # centrada en Z, espesor centrado en X
-
-    # Colocar costillas a los laterales:
-    #   izquierda: centro en x = -L/2 + T/2
-    #   derecha:   centro en x = +L/2 - T/2
-    rib_left = rib0.copy()
-    rib_left.apply_translation((-L / 2.0 + T / 2.0, 0.0, 0.0))
-
-    rib_right = rib0.copy()
-    rib_right.apply_translation((+L / 2.0 - T / 2.0, 0.0, 0.0))
+    ribs = _ribs(L=L, W=W, H=H, T=T)
 
     # ---- Superficie superior (apoyo del portátil) ----
     # rectangle_plate(L, ancho, T) -> placa con grosor T (eje Y en tus helpers)
@@ -90,7 +114,7 @@ def make_model(params: Dict[str, Any]) -> trimesh.Trimesh:
     base.apply_translation((0.0, 0.0, W / 2.0 - T * 1.25))
 
     # ---- Ensamble final ----
-    mesh = concatenate([rib_left, rib_right, top, lip, base])
+    mesh = concatenate([ribs, top, lip, base])
     return mesh
 
 
@@ -1,12 +1,14 @@
 from __future__ import annotations
 from typing import Dict, Any
+import shapely.geometry as sg
 import trimesh
 
+from ._helpers import param_num as _num, sections_for
+from .utils_geo import extrude_centered
+
 SLUGS = ["mic-arm-clip"]
 
-def _num(p: Dict[str, Any], k: str, d: float) -> float:
-    try: return float(str(p.get(k, d)).replace(",", "."))
-    except: return d
+_MIN_OPENING = 1e-3
 
 def make(params: Dict[str, Any]) -> trimesh.Trimesh:
     arm_d = _num(params, "arm_d", 20.0)
@@ -14,16 +16,16 @@ def make(params: Dict[str, Any]) -> trimesh.Trimesh:
     width = _num(params, "width", 14.0)
     opening = _num(params, "opening", 0.6)
 
-    outer = trimesh.creation.cylinder(radius=(arm_d/2+clip_t), height=width, sections=96)
-    inner = trimesh.creation.cylinder(radius=(arm_d/2), height=width*1.2, sections=96)
-    try:
-        ring = outer.difference(inner)
-        slot = trimesh.creation.box((opening, (arm_d+clip_t*2), width*1.3))
-        slot.apply_translation((arm_d/2,0,0))
-        out = ring.difference(slot)
-        if isinstance(out, trimesh.Trimesh): return out
-    except Exception:
-        pass
-    return outer
+    # Sección 2D (anillo menos la ranura) y una sola extrusión: sin booleanos 3D.
+    # Mismo nº de lados en ambos círculos: facetas alineadas en el anillo.
+    r_out = arm_d/2 + clip_t
+    res = sections_for(r_out) // 4  # buffer() cuenta segmentos por cuadrante
+    outer = sg.Point(0, 0).buffer(r_out, resolution=res)
+    inner = sg.Point(0, 0).buffer(arm_d/2, resolution=res)
+    profile = outer.difference(inner)
+    if opening > _MIN_OPENING:  # anillo cerrado: nada que ranurar
+        slot = sg.box(arm_d/2 - opening/2, -r_out, arm_d/2 + opening/2, r_out)
+        profile = profile.difference(slot)
+    return extrude_centered(profile, width)
 
 BUILD = {"make": make}
@@ -2,19 +2,24 @@
 from __future__ import annotations
 from typing import Dict, Any
 import trimesh
-from ._helpers import num, box, difference
+from ._helpers import MeshBuilder, memo_build, num
 
 NAME = "monitor_stand"
 SLUGS = ["monitor-stand"]
 
+@memo_build()
 def make_model(p: Dict[str, Any]) -> trimesh.Trimesh:
     W = float(num(p.get("width") or p.get("length_mm"), 400.0))
     D = float(num(p.get("depth") or p.get("width_mm"), 200.0))
     H = float(num(p.get("height") or p.get("height_mm"), 70.0))
     T = float(num(p.get("wall") or p.get("thickness_mm"), 4.0))
 
-    outer = box((W, D, H))
-    inner = box((max(W - 2 * T, 1), max(D - 2 * T, 1), max(H - 2 * T, 1)))
-    return difference(outer, inner)
+    # Caja hueca sin CSG: exterior + interior con las caras invertidas
+    # (el hueco queda cerrado, igual que outer − inner).
+    inner = (max(W - 2 * T, 1), max(D - 2 * T, 1), max(H - 2 * T, 1))
+    mb = MeshBuilder().add_box((W, D, H))
+    if inner[0] < W and inner[1] < D and inner[2] < H:
+        mb.add_box(inner, flip=True)
+    return mb.build()
 
 BUILD = {"make": make_model}
@@ -2,7 +2,7 @@
 from __future__ import annotations
 from typing import Dict, Any
 import trimesh
-from ._helpers import num, box
+from ._helpers import assemble_boxes, num
 
 NAME = "phone_dock"
 SLUGS = ["phone-dock"]
@@ -12,11 +12,10 @@ def make_model(p: Dict[str, Any]) -> trimesh.Trimesh:
     D = float(num(p.get("base_d") or p.get("width_mm"), 110.0))
     T = float(num(p.get("wall") or p.get("thickness_mm"), 4.0))
 
-    base = box((W, D, T))
-    back = box((W, T, D * 0.7))
-    back.apply_translation((0, -D / 2 + T / 2, D * 0.35))
-    lip = box((W, T, T * 1.5))
-    lip.apply_translation((0, D / 2 - T / 2, T * 0.75))
-    return trimesh.util.concatenate([base, back, lip])
+    return assemble_boxes([
+        ((W, D, T), (0, 0, 0)),                                   # base
+        ((W, T, D * 0.7), (0, -D / 2 + T / 2, D * 0.35)),         # respaldo
+        ((W, T, T * 1.5), (0, D / 2 - T / 2, T * 0.75)),          # labio
+    ])
 
 BUILD = {"make": make_model}
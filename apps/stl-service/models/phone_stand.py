@@ -3,6 +3,8 @@ from typing import Dict, Any
 import math
 import trimesh
 
+from ._helpers import box, memo_build
+
 NAME = "phone_stand"
 
 TYPES = {
@@ -23,6 +25,7 @@ DEFAULTS = {
     "thickness": 4.0,
 }
 
+@memo_build()
 def make_model(params: Dict[str, Any]) -> trimesh.Trimesh:
     depth = params.get("support_depth", None)
     if depth is None:
@@ -31,6 +34,6 @@ def make_model(params: Dict[str, Any]) -> trimesh.Trimesh:
     W = float(params.get("width", DEFAULTS["width"]))
     T = float(params.get("thickness", DEFAULTS["thickness"]))
     # Base rectangular estable (sin ángulos) para fiabilidad de STL.
-    base = trimesh.creation.box(extents=(D, T, W))
+    base = box((D, T, W))
     base.apply_translation((0, T / 2.0, 0))
     return base
@@ -2,26 +2,21 @@ from __future__ import annotations
 from typing import Dict, Any
 import trimesh
 
+from ._helpers import memo_build, open_box, param_num as _num
+
 SLUGS = ["raspi-case"]
 
-def _num(p: Dict[str, Any], k: str, d: float) -> float:
-    try: return float(str(p.get(k, d)).replace(",", "."))
-    except: return d
 
+@memo_build()
 def make(params: Dict[str, Any]) -> trimesh.Trimesh:
     w = _num(params, "board_w", 85.0)
     l = _num(params, "board_l", 56.0)
     h = _num(params, "board_h", 17.0)
     wall = _num(params, "wall", 2.2)
 
-    outer = trimesh.creation.box((w + 2*wall, l + 2*wall, h + wall))
-    inner = trimesh.creation.box((w, l, h))
-    inner.apply_translation((0,0,wall/2))
-    try:
-        out = outer.difference(inner)
-        if isinstance(out, trimesh.Trimesh): return out
-    except Exception:
-        pass
-    return outer
+    # Exterior menos interior (abierto arriba) como una sola malla cerrada
+    ox, oy = w/2 + wall, l/2 + wall
+    top = h/2 + wall/2
+    return open_box((-ox, -oy, -top), (ox, oy, top), (-w/2, -l/2, wall - top), (w/2, l/2))
 
 BUILD = {"make": make}
@@ -1,17 +1,11 @@
 from __future__ import annotations
-from typing import Dict, Any, List
+from typing import Dict, Any
 import trimesh
 
-SLUGS = ["ssd-holder"]
+from ._helpers import assemble_boxes, param_num as _num
 
-def _num(p: Dict[str, Any], k: str, d: float) -> float:
-    try: return float(str(p.get(k, d)).replace(",", "."))
-    except: return d
+SLUGS = ["ssd-holder"]
 
-def _box(x,y,z): return trimesh.creation.box((x,y,z))
-def _union(ms: List[trimesh.Trimesh]):
-    try: return trimesh.util.concatenate(ms)
-    except: return ms[0]
 
 def make(params: Dict[str, Any]) -> trimesh.Trimesh:
     drive_w = _num(params, "drive_w", 69.85)
@@ -20,14 +14,14 @@ def make(params: Dict[str, Any]) -> trimesh.Trimesh:
     wall    = _num(params, "wall", _num(params, "thickness_mm", 3.0))
     H       = _num(params, "height_mm", 20.0)
 
-    base = _box(bay_w, drive_l, wall)
-    base.apply_translation((0,0,wall/2))
-
+    # base + laterales + frontal/trasera en un solo bloque de arrays
     side = max(1.0, (bay_w - drive_w)/2)
-    left  = _box(side, drive_l, H);  left.apply_translation((-drive_w/2 - side/2, 0, H/2 + wall))
-    right = _box(side, drive_l, H); right.apply_translation(( drive_w/2 + side/2, 0, H/2 + wall))
-    front = _box(bay_w, wall, H/2); front.apply_translation((0, -drive_l/2 + wall/2, wall + H/4))
-    rear  = _box(bay_w, wall, H/2);  rear.apply_translation((0,  drive_l/2 - wall/2, wall + H/4))
-    return _union([base, left, right, front, rear])
+    return assemble_boxes([
+        ((bay_w, drive_l, wall), (0, 0, wall/2)),                        # base
+        ((side, drive_l, H),     (-drive_w/2 - side/2, 0, H/2 + wall)),  # left
+        ((side, drive_l, H),     ( drive_w/2 + side/2, 0, H/2 + wall)),  # right
+        ((bay_w, wall, H/2),     (0, -drive_l/2 + wall/2, wall + H/4)),  # front
+        ((bay_w, wall, H/2),     (0,  drive_l/2 - wall/2, wall + H/4)),  # rear
+    ])
 
 BUILD = {"make": make}
@@ -2,7 +2,7 @@
 from __future__ import annotations
 from typing import Dict, Any
 import trimesh
-from ._helpers import num, box
+from ._helpers import assemble_boxes, num
 
 NAME = "tablet_stand"
 SLUGS = ["tablet-stand"]
@@ -13,11 +13,10 @@ def make_model(p: Dict[str, Any]) -> trimesh.Trimesh:
     wall = float(num(p.get("wall") or p.get("thickness_mm"), 4.0))
     lip = float(num(p.get("lip_h"), 10.0))
 
-    base = box((W, D, wall))
-    back = box((W, wall, D * 0.8))
-    back.apply_translation((0, -D / 2 + wall / 2, D * 0.4))
-    lipm = box((W, wall, lip))
-    lipm.apply_translation((0, D / 2 - wall / 2, wall / 2 + lip / 2))
-    return trimesh.util.concatenate([base, back, lipm])
+    return assemble_boxes([
+        ((W, D, wall), (0, 0, 0)),                                        # base
+        ((W, wall, D * 0.8), (0, -D / 2 + wall / 2, D * 0.4)),            # respaldo
+        ((W, wall, lip), (0, D / 2 - wall / 2, wall / 2 + lip / 2)),      # labio
+    ])
 
 BUILD = {"make": make_model}
@@ -1,7 +1,11 @@
 from __future__ import annotations
 import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, Mapping, Optional, Literal, Tuple, List, Union
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Literal, Tuple, List, Union
 
 import numpy as np
 import trimesh
@@ -22,8 +26,14 @@ try:
 except Exception:
     _trimesh_text = None
 
+import shapely
 from shapely.geometry import Polygon, MultiPolygon
 from shapely.ops import unary_union
+from trimesh.boolean import difference as _tm_difference, union as _tm_union
+
+# Motor booleano resuelto una sola vez al importar (no por operación)
+from ._helpers import _BOOL_ENGINE as _ENGINE, _as_volume, _mf_to_trimesh, _to_mf, fast_concat
+from .utils_geo import _components, extrude_polygons
 
 Anchor = Literal["top", "bottom", "front", "back", "left", "right"]
 
@@ -39,10 +49,14 @@ def _concat(meshes: Iterable[trimesh.Trimesh]) -> trimesh.Trimesh:
     lst = [m for m in meshes if isinstance(m, trimesh.Trimesh) and len(m.vertices)]
     if not lst:
         return trimesh.Trimesh()
-    return trimesh.util.concatenate(lst)
+    return fast_concat(lst)
+
+
+# (mín, máx, extensión, centro) de la caja de una malla
+Box = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
 
 
-def _bounds_center_extents(mesh: trimesh.Trimesh) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+def _bounds_center_extents(mesh: trimesh.Trimesh) -> Box:
     mn, mx = mesh.bounds
     mn = np.asarray(mn, dtype=float)
     mx = np.asarray(mx, dtype=float)
@@ -123,7 +137,258 @@ def _lazy_trimesh_text_fn():
 
 # ------------------------ Texto -> sólido ------------------------ #
 
+# (fichero de fuente, mtime, glifo) -> (V, F, bbox XY, contornos) del glifo
+# extruido a tamaño 1 y profundidad 1. Con el mtime en la clave, una fuente
+# reescrita en disco no reutiliza glifos viejos.
+# La escala y la profundidad reales son lineales: se aplican al montar la cadena,
+# así que un mismo glifo sirve para cualquier texto, tamaño y profundidad.
+# LRU acotada: la fuente puede venir del usuario y no debe crecer sin límite.
+Glyph = Tuple[np.ndarray, np.ndarray, np.ndarray, Tuple[Polygon, ...]]
+_GLYPH_CACHE_MAX = 4096
+_GLYPH_CACHE: "OrderedDict[Tuple[str, float, str], Glyph]" = OrderedDict()
+_GLYPH_LOCK = threading.Lock()
+_FONT_LOCK = threading.Lock()
+_NO_GLYPH: Glyph = (np.empty((0, 3)), np.empty((0, 3), dtype=np.int64), np.zeros((2, 2)), ())
+
+
+def _glyph_polygons(verts: np.ndarray, codes: np.ndarray) -> List[Polygon]:
+    """Contornos de un glifo -> polígonos con huecos (regla nonzero por orientación)."""
+    from matplotlib.path import Path as MplPath
+    rings = [r for r in MplPath(verts, codes).to_polygons() if len(r) >= 4]
+    if not rings:
+        return []
+    # Todos los anillos de una vez (shapely 2): coordenadas apiladas + índice
+    # de anillo, sin un Polygon por contorno en Python.
+    lr = shapely.linearrings(np.vstack(rings), indices=np.repeat(np.arange(len(rings)), [len(r) for r in rings]))
+    ccw = shapely.is_ccw(lr)
+    polys = shapely.polygons(lr)
+    order = np.argsort(-shapely.area(polys), kind="stable")
+    bad = ~shapely.is_valid(polys)
+    if bad.any():
+        polys[bad] = shapely.buffer(polys[bad], 0)
+    # el contorno mayor fija la orientación de los "llenos"
+    fill = ccw == ccw[order[0]]
+    keep = order[~shapely.is_empty(polys[order])]
+    solid = polys[keep[fill[keep]]]
+    holes = polys[keep[~fill[keep]]]
+    if not len(solid):
+        return []
+    simple = _simple_glyph(solid, holes)
+    if simple is not None:
+        return simple
+    geom = unary_union(list(solid))
+    if len(holes):
+        geom = geom.difference(unary_union(list(holes)))
+    return [g for g in getattr(geom, "geoms", [geom]) if isinstance(g, Polygon) and not g.is_empty]
+
+
+def _simple_glyph(solid: np.ndarray, holes: np.ndarray) -> Optional[List[Polygon]]:
+    """
+    Caso normal sin booleanos de GEOS: llenos que ni se acercan entre sí y
+    cada hueco estrictamente dentro de un único lleno, sin acercarse a otros
+    huecos (por cajas, en numpy). Los polígonos se montan directamente; None
+    si hay que pasar por unary_union/difference.
+    """
+    parts = np.concatenate([solid, holes])
+    if (shapely.get_type_id(parts) != 3).any() or shapely.get_num_interior_rings(parts).any():
+        return None
+    b = shapely.bounds(parts)
+    lo, hi = b[:, :2], b[:, 2:]
+    near = np.all((lo[:, None] <= hi[None]) & (lo[None] <= hi[:, None]), axis=2)
+    np.fill_diagonal(near, False)
+    ns = len(solid)
+    if near[:ns, :ns].any() or near[ns:, ns:].any():
+        return None
+    if not len(holes):
+        return list(solid)
+    inside = shapely.contains_properly(solid[:, None], holes[None])
+    if (inside.sum(axis=0) != 1).any():
+        return None
+    owner = inside.argmax(axis=0)
+    out = []
+    for k in range(ns):
+        hk = shapely.get_exterior_ring(holes[owner == k])
+        out.append(shapely.polygons(shapely.get_exterior_ring(solid[k]), holes=hk if len(hk) else None))
+    return out
+
+
+def _glyph_solid(font_file: str, font_mtime: float, glyph_id: str, glyph_map: Mapping) -> Glyph:
+    key = (font_file, font_mtime, glyph_id)
+    with _GLYPH_LOCK:
+        hit = _GLYPH_CACHE.get(key)
+        if hit is not None:
+            _GLYPH_CACHE.move_to_end(key)
+            return hit
+    out = _NO_GLYPH
+    try:
+        verts, codes = glyph_map[glyph_id]
+        if len(verts):
+            from matplotlib.textpath import text_to_path
+            polys = _glyph_polygons(np.asarray(verts, dtype=float) / text_to_path.FONT_SCALE, codes)
+            m = extrude_polygons(polys, 1.0)
+            if m is not None:
+                V = m.vertices.view(np.ndarray)
+                F = m.faces.view(np.ndarray)
+                V.setflags(write=False)  # compartidos entre peticiones
+                F.setflags(write=False)
+                bb = np.array([V[:, :2].min(axis=0), V[:, :2].max(axis=0)])
+                out = (V, F, bb, tuple(polys))
+    except Exception as e:
+        _log("glyph error:", glyph_id, e)
+    with _GLYPH_LOCK:
+        out = _GLYPH_CACHE.setdefault(key, out)
+        if len(_GLYPH_CACHE) > _GLYPH_CACHE_MAX:
+            _GLYPH_CACHE.popitem(last=False)
+    return out
+
+
+def _merge_overlapping(placed: List[tuple], boxes: np.ndarray) -> List[tuple]:
+    """
+    Sustituye cada grupo de glifos colocados (V, F, escala, origen, polígonos)
+    que se solapan por un único sólido, ya en coordenadas del texto. Las cajas
+    descartan casi todos los pares sin tocar shapely; el contorno 2D decide
+    si se pisan de verdad.
+    """
+    lo, hi = boxes[:, 0], boxes[:, 1]
+    near = np.all((lo[:, None] < hi[None]) & (lo[None] < hi[:, None]), axis=2)
+    i, j = np.nonzero(np.triu(near, 1))
+    if not len(i):
+        return placed
+
+    shapes: Dict[int, object] = {}
+
+    def shape(k: int):
+        if k not in shapes:
+            _, _, sc, o, polys = placed[k]
+            shapes[k] = shapely.transform(unary_union(polys), lambda xy: xy * sc + o)
+        return shapes[k]
+
+    # interiores con área en común (tocarse en un borde no cuenta)
+    hit = np.array([shape(a).relate_pattern(shape(b), "2********") for a, b in zip(i, j)], dtype=bool)
+    if not hit.any():
+        return placed
+    i, j = i[hit], j[hit]
+    labels = _components(len(placed), np.r_[i, j], np.r_[j, i])
+
+    out = []
+    for k in range(len(placed)):
+        group = np.flatnonzero(labels == labels[k])
+        if len(group) == 1:
+            out.append(placed[k])
+            continue
+        if group[0] != k:
+            continue
+        # Unión 3D (de pocas decenas de caras) y no 2D + earcut: los bordes
+        # colineales que deja la unión de contornos hacen que earcut descarte
+        # triángulos nulos y la tapa ya no cierre con las paredes.
+        parts = []
+        for g in group:
+            V, F, sc, o, _ = placed[g]
+            parts.append(trimesh.Trimesh(vertices=V * (sc, sc, 1.0) + (o[0], o[1], 0.0), faces=F, process=False))
+        try:
+            m = _tm_union(parts, engine=_ENGINE)
+        except Exception as e:
+            _log("glyph union fail:", e)
+            m = None
+        if isinstance(m, trimesh.Trimesh) and len(m.faces):
+            out.append((m.vertices.view(np.ndarray), m.faces.view(np.ndarray), 1.0, np.zeros(2), ()))
+        else:
+            out.extend(placed[g] for g in group)
+    return out
+
+
+def _font_key(font_spec: Optional[str]) -> Tuple[Optional[str], float]:
+    """Fuente resuelta y su mtime: si el fichero cambia, las cachés no lo reutilizan."""
+    font_path = _resolve_font(font_spec or None)
+    try:
+        return font_path, (os.path.getmtime(font_path) if font_path else 0.0)
+    except OSError:
+        return font_path, 0.0
+
+
 def _make_text_solid(text: str, height: float, depth: float, font_spec: Optional[str]) -> Optional[trimesh.Trimesh]:
+    """
+    Sólido del texto, cacheado por (texto, tamaño, profundidad, fuente
+    resuelta + mtime). La malla devuelta es compartida y de solo lectura:
+    `_place_text_on_face` crea siempre una malla nueva.
+    """
+    font_path, font_mtime = _font_key(font_spec)
+    return _text_solid(text, round(float(height), 4), round(float(depth), 4), font_path, font_mtime)
+
+
+# Hilos para construir varios textos a la vez: shapely/GEOS y earcut sueltan el GIL.
+_TEXT_WORKERS = max(1, min(4, os.cpu_count() or 1))
+_POOL: Optional[ThreadPoolExecutor] = None
+_POOL_LOCK = threading.Lock()
+
+
+def _pool() -> ThreadPoolExecutor:
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = ThreadPoolExecutor(max_workers=_TEXT_WORKERS, thread_name_prefix="forge-text")
+        return _POOL
+
+
+# Marca de hilo: True mientras se ejecuta una tarea lanzada por _pool_map.
+_IN_POOL = threading.local()
+
+
+def _pool_map(fn: Callable[[Any], Any], items: Iterable[Any]) -> List[Any]:
+    """`_pool().map` con cada tarea marcada en _IN_POOL (ver _prefetch_glyphs)."""
+    def task(item: Any) -> Any:
+        _IN_POOL.active = True
+        try:
+            return fn(item)
+        finally:
+            _IN_POOL.active = False
+    return list(_pool().map(task, items))
+
+
+# Por debajo de esto no compensa repartir glifos entre hilos.
+_PREFETCH_MIN = 8
+
+
+def _prefetch_glyphs(font_file: str, font_mtime: float, glyph_ids: List[str], glyph_map: Mapping) -> None:
+    """Construye en el pool los glifos de la cadena que falten en la caché."""
+    # desde una tarea del pool no se encola más trabajo: esperaría a hilos
+    # que pueden estar todos ocupados esperándola a ella
+    if _TEXT_WORKERS < 2 or getattr(_IN_POOL, "active", False):
+        return
+    with _GLYPH_LOCK:
+        missing = [g for g in dict.fromkeys(glyph_ids) if (font_file, font_mtime, g) not in _GLYPH_CACHE]
+    if len(missing) >= _PREFETCH_MIN:
+        _pool_map(lambda g: _glyph_solid(font_file, font_mtime, g, glyph_map), missing)
+
+
+def _make_text_solids(
+    specs: List[Tuple[str, float, float, Optional[str]]],
+) -> List[Optional[trimesh.Trimesh]]:
+    """`_make_text_solid` para varios (texto, tamaño, profundidad, fuente); en paralelo si hay más de uno distinto."""
+    uniq = list(dict.fromkeys(specs))
+    if len(uniq) < 2 or _TEXT_WORKERS < 2:
+        solids = [_make_text_solid(*s) for s in uniq]
+    else:
+        solids = _pool_map(lambda s: _make_text_solid(*s), uniq)
+    done = dict(zip(uniq, solids))
+    return [done[s] for s in specs]
+
+
+@lru_cache(maxsize=256)
+def _text_solid(
+    text: str, height: float, depth: float, font_path: Optional[str], font_mtime: float,
+) -> Optional[trimesh.Trimesh]:
+    m = _build_text_solid(text, height, depth, font_path, font_mtime)
+    if m is not None:
+        # compartida entre peticiones: cualquier escritura accidental falla
+        m.vertices.flags.writeable = False
+        m.faces.flags.writeable = False
+    return m
+
+
+def _build_text_solid(
+    text: str, height: float, depth: float, font_path: Optional[str], font_mtime: float,
+) -> Optional[trimesh.Trimesh]:
     """
     Crea un sólido 3D del texto:
       - height (mm) ≈ altura de mayúsculas
@@ -136,8 +401,6 @@ def _make_text_solid(text: str, height: float, depth: float, font_spec: Optional
         _log("empty text string")
         return None
 
-    font_path = _resolve_font(font_spec)
-
     # ---- Opción A: función de Trimesh (preferida)
     text_fn = _lazy_trimesh_text_fn()
     if text_fn is not None:
@@ -193,98 +456,75 @@ def _make_text_solid(text: str, height: float, depth: float, font_spec: Optional
                     else:
                         geom_list = [g for g in (geom or []) if isinstance(g, Polygon)]
 
-                    solids: List[trimesh.Trimesh] = []
-                    for poly in geom_list:
-                        try:
-                            if not poly.is_valid:
-                                poly = poly.buffer(0)
-                            if poly.is_empty:
-                                continue
-                            m = trimesh.creation.extrude_polygon(poly, height=float(depth))
-                            solids.append(m)
-                        except Exception as e:
-                            _log("extrude_polygon error (trimesh path):", e)
-                            continue
-
-                    if solids:
-                        return _concat(solids)
+                    solid = extrude_polygons(geom_list, depth)
+                    if solid is not None:
+                        return solid
                 else:
                     _log("no polygons from trimesh.text()")
         except Exception as e:
             _log("trimesh.text execution error:", e)
 
-    # ---- Opción B: fallback con Matplotlib TextPath
+    # ---- Opción B: fallback con Matplotlib (glifos cacheados por fuente)
     try:
-        from matplotlib.textpath import TextPath
-        from matplotlib.font_manager import FontProperties
+        from matplotlib.font_manager import FontProperties, findfont, get_font
+        from matplotlib.textpath import text_to_path
         fp = FontProperties(fname=font_path) if font_path else FontProperties(family="DejaVu Sans")
-
-        # Generamos a tamaño base 1.0 y luego reescalamos a 'height'
-        tp = TextPath((0, 0), text, size=1.0, prop=fp)
-        rings = [r for r in tp.to_polygons() if len(r) >= 3]
-        if not rings:
-            _log("TextPath.to_polygons() vacío")
-            return None
-
-        all_pts = np.vstack(rings)
-        miny, maxy = float(all_pts[:, 1].min()), float(all_pts[:, 1].max())
-        src_h = max(maxy - miny, 1e-6)
-        scale = float(height) / src_h
-
-        # Escala y centra
-        scaled_rings = []
-        for r in rings:
-            rr = np.asarray(r, dtype=float) * scale
-            scaled_rings.append(rr)
-
-        all_pts2 = np.vstack(scaled_rings)
-        minx, miny = all_pts2[:, 0].min(), all_pts2[:, 1].min()
-        maxx, maxy = all_pts2[:, 0].max(), all_pts2[:, 1].max()
-        cx, cy = (minx + maxx) * 0.5, (miny + maxy) * 0.5
-
-        centered = [np.column_stack((rr[:, 0] - cx, rr[:, 1] - cy)) for rr in scaled_rings]
-
-        # Polígonos -> extrusión
-        polys: List[Polygon] = []
-        for rr in centered:
-            try:
-                p = Polygon(rr)
-                if not p.is_valid:
-                    p = p.buffer(0)
-                if not p.is_empty:
-                    polys.append(p)
-            except Exception:
+        font_file = findfont(fp)
+
+        # Maquetación (avances + kerning) de toda la cadena: barata, sin curvas.
+        # El FT2Font de matplotlib es compartido y no es thread-safe.
+        with _FONT_LOCK:
+            font = get_font(font_file)
+            font.set_size(text_to_path.FONT_SCALE, text_to_path.DPI)
+            glyph_info, glyph_map, _ = text_to_path.get_glyphs_with_font(font, text)
+
+        # Glifos aún sin cachear (arranque en frío, fuente nueva): se extruyen
+        # en paralelo antes de montar la cadena, que ya solo lee la caché.
+        _prefetch_glyphs(font_file, font_mtime, [g[0] for g in glyph_info], glyph_map)
+
+        # 1) Glifos y su posición (tamaño 1); la caja total sale de las bbox cacheadas
+        placed = []
+        mn = np.full(2, np.inf)
+        mx = np.full(2, -np.inf)
+        boxes = []
+        for glyph_id, x, y, sc in glyph_info:
+            V, F, bb, polys = _glyph_solid(font_file, font_mtime, glyph_id, glyph_map)
+            if not len(V):
                 continue
-
-        if not polys:
-            _log("fallback: no polygons after TextPath")
+            o = np.array([x, y]) / text_to_path.FONT_SCALE
+            boxes.append(bb * sc + o)
+            mn = np.minimum(mn, boxes[-1][0])
+            mx = np.maximum(mx, boxes[-1][1])
+            placed.append((V, F, sc, o, polys))
+
+        if not placed:
+            _log("fallback: no glyph outlines")
             return None
 
-        try:
-            geom = unary_union(polys)
-        except Exception:
-            geom = polys
-
-        if isinstance(geom, (Polygon, MultiPolygon)):
-            geom_list = list(geom.geoms) if isinstance(geom, MultiPolygon) else [geom]
-        else:
-            geom_list = [g for g in (geom or []) if isinstance(g, Polygon)]
-
-        solids: List[trimesh.Trimesh] = []
-        for poly in geom_list:
-            try:
-                if not poly.is_valid:
-                    poly = poly.buffer(0)
-                if poly.is_empty:
-                    continue
-                m = trimesh.creation.extrude_polygon(poly, height=float(depth))
-                solids.append(m)
-            except Exception as e:
-                _log("extrude_polygon error (TextPath):", e)
-                continue
-
-        if solids:
-            return _concat(solids)
+        # Glifos que se pisan (kerning, acentos): sus sólidos sueltos se solapan
+        # y el booleano contaría dos veces el volumen común. Solo esos grupos
+        # se funden con una unión 3D de sus sólidos ya extruidos (no unión 2D
+        # + extrusión: ver _merge_overlapping); el resto usa el sólido cacheado.
+        placed = _merge_overlapping(placed, np.array(boxes))
+        nv = sum(len(p[0]) for p in placed)
+        nf = sum(len(p[1]) for p in placed)
+
+        # 2) Una sola pasada por glifo: escala a 'height'/'depth', posición y
+        #    centrado fundidos en V * k + t, escritos directamente en el buffer final
+        scale = float(height) / max(float(mx[1] - mn[1]), 1e-6)
+        c = (mn + mx) * 0.5
+        Vout = np.empty((nv, 3))
+        Fout = np.empty((nf, 3), dtype=np.int64)
+        iv = jf = 0
+        for V, F, sc, o, _ in placed:
+            k = scale * sc
+            v = Vout[iv:iv + len(V)]
+            np.multiply(V, (k, k, float(depth)), out=v)
+            v += (scale * (o[0] - c[0]), scale * (o[1] - c[1]), 0.0)
+            np.add(F, iv, out=Fout[jf:jf + len(F)])
+            iv += len(V)
+            jf += len(F)
+        return trimesh.Trimesh(vertices=Vout, faces=Fout, process=False)
     except Exception as e:
         _log("Matplotlib TextPath fallback error:", e)
 
@@ -294,48 +534,60 @@ def _make_text_solid(text: str, height: float, depth: float, font_spec: Optional
 
 # ------------------------ Posicionamiento ------------------------ #
 
-def _axis_from_anchor(mesh: trimesh.Trimesh, anchor: Anchor) -> Tuple[np.ndarray, np.ndarray]:
-    mn, mx, _, c = _bounds_center_extents(mesh)
-    if anchor == "top":
-        origin = np.array([c[0], c[1], mx[2]])
-        normal = np.array([0, 0, 1.0])
-    elif anchor == "bottom":
-        origin = np.array([c[0], c[1], mn[2]])
-        normal = np.array([0, 0, -1.0])
-    elif anchor == "front":
-        origin = np.array([c[0], mx[1], c[2]])
-        normal = np.array([0, 1.0, 0])
-    elif anchor == "back":
-        origin = np.array([c[0], mn[1], c[2]])
-        normal = np.array([0, -1.0, 0])
-    elif anchor == "right":
-        origin = np.array([mx[0], c[1], c[2]])
-        normal = np.array([1.0, 0, 0])
-    else:  # left
-        origin = np.array([mn[0], c[1], c[2]])
-        normal = np.array([-1.0, 0, 0])
+# Cara de cada ancla: (eje, signo) de su normal. Cualquier otro valor se
+# trata como "left".
+_ANCHOR_AXIS = {
+    "top": (2, 1.0), "bottom": (2, -1.0),
+    "front": (1, 1.0), "back": (1, -1.0),
+    "right": (0, 1.0), "left": (0, -1.0),
+}
+
+
+def _axis_from_anchor(box: Box, anchor: Anchor) -> Tuple[np.ndarray, np.ndarray]:
+    mn, mx, _, c = box
+    ax, sgn = _ANCHOR_AXIS.get(anchor, _ANCHOR_AXIS["left"])
+    origin = c.copy()
+    origin[ax] = mx[ax] if sgn > 0 else mn[ax]
+    normal = np.zeros(3)
+    normal[ax] = sgn
     return origin, normal
 
 
-def _frame_from_normal(normal: np.ndarray) -> np.ndarray:
-    n = np.asarray(normal, dtype=float)
-    n /= max(1e-9, np.linalg.norm(n))
-    R = trimesh.geometry.align_vectors(np.array([0, 0, 1.0]), n)
-    if R is None:
-        R = np.eye(4)
+# Ejes (u, v) del texto sobre cada cara. Con la normal forman el mismo marco
+# que align_vectors(+Z, normal), escrito en forma cerrada: sin SVD al importar
+# ni por op.
+_ANCHOR_UV = {
+    "top": ((1.0, 0, 0), (0, 1.0, 0)),
+    "bottom": ((-1.0, 0, 0), (0, 1.0, 0)),
+    "front": ((0, 0, -1.0), (-1.0, 0, 0)),
+    "back": ((0, 0, -1.0), (1.0, 0, 0)),
+    "right": ((0, 0, -1.0), (0, 1.0, 0)),
+    "left": ((0, 0, 1.0), (0, 1.0, 0)),
+}
+
+
+def _anchor_frame(anchor: str) -> np.ndarray:
+    ax, sgn = _ANCHOR_AXIS[anchor]
+    R = np.eye(4)
+    R[:3, 0], R[:3, 1] = _ANCHOR_UV[anchor]
+    R[:3, 2] = np.eye(3)[ax] * sgn
+    R.setflags(write=False)  # compartida entre peticiones
     return R
 
 
+_ANCHOR_FRAMES = {a: _anchor_frame(a) for a in _ANCHOR_AXIS}
+
+
 def _place_text_on_face(
     text_mesh: trimesh.Trimesh,
-    base: trimesh.Trimesh,
+    box: Box,
     anchor: Anchor,
     pos: Tuple[float, float, float],
     depth: float,
     mode: str,
 ) -> trimesh.Trimesh:
-    origin, normal = _axis_from_anchor(base, anchor)
-    R = _frame_from_normal(normal)
+    origin, _ = _axis_from_anchor(box, anchor)
+    R = _ANCHOR_FRAMES.get(anchor, _ANCHOR_FRAMES["left"])
 
     u = R[:3, 0]
     v = R[:3, 1]
@@ -344,22 +596,52 @@ def _place_text_on_face(
     n_clear = 0.05  # mm, evita z-fighting
     offset_n = (float(depth) * 0.5 + n_clear) * (1.0 if mode == "emboss" else -1.0)
 
-    T = np.eye(4)
-    T[:3, 3] = origin + u * float(pos[0]) + v * float(pos[1]) + n * float(offset_n)
-
-    M = T @ R
+    # El marco no lleva traslación: rotar con su 3x3 y sumar el desplazamiento
+    # en el mismo buffer, sin montar ni multiplicar matrices 4x4.
+    t = origin + u * float(pos[0]) + v * float(pos[1]) + n * float(offset_n)
 
-    tm = text_mesh.copy()
-    tm.apply_transform(M)
-    return tm
+    # Malla nueva con los vértices ya transformados: el sólido de entrada
+    # (cacheado) no se copia ni se modifica.
+    V = text_mesh.vertices.view(np.ndarray) @ R[:3, :3].T
+    V += t
+    return trimesh.Trimesh(vertices=V, faces=text_mesh.faces.view(np.ndarray).copy(), process=False)
 
 
 # ------------------------ Booleanos ------------------------ #
 
-def _boolean_union(a: trimesh.Trimesh, b: trimesh.Trimesh) -> Optional[trimesh.Trimesh]:
+# Herramienta de un booleano: una malla (textos que no se pisan, concatenados)
+# o una lista de mallas que se pisan entre sí y deben entrar por separado.
+Tool = Union[trimesh.Trimesh, List[trimesh.Trimesh]]
+
+
+def _tool_parts(tool: Tool) -> List[trimesh.Trimesh]:
+    return tool if isinstance(tool, list) else [tool]
+
+
+def _clashing(meshes: List[trimesh.Trimesh]) -> np.ndarray:
+    """Por malla: ¿su caja se cruza con la de alguna otra de la lista?"""
+    if len(meshes) < 2:
+        return np.zeros(len(meshes), dtype=bool)
+    b = np.array([m.bounds for m in meshes])
+    lo, hi = b[:, 0], b[:, 1]
+    near = np.all((lo[:, None] < hi[None]) & (lo[None] < hi[:, None]), axis=2)
+    np.fill_diagonal(near, False)
+    return near.any(axis=1)
+
+
+def _make_tool(group: List[trimesh.Trimesh]) -> Tool:
+    """
+    Textos que no se pisan van concatenados en una sola herramienta. Si se
+    pisan, la concatenación tendría volumen solapado (el motor lo cuenta dos
+    veces): entonces cada uno entra al booleano como malla propia.
+    """
+    return group if _clashing(group).any() else _concat(group)
+
+
+def _boolean_union(a: trimesh.Trimesh, b: Tool) -> Optional[trimesh.Trimesh]:
+    # manifold solo acepta volúmenes cerrados: se reparan las entradas que no lo son
     try:
-        from trimesh.boolean import union
-        res = union([a, b], engine=None)
+        res = _tm_union([_as_volume(a)] + [_as_volume(m) for m in _tool_parts(b)], engine=_ENGINE)
         if isinstance(res, trimesh.Trimesh) and len(res.vertices):
             return res
     except Exception as e:
@@ -367,10 +649,13 @@ def _boolean_union(a: trimesh.Trimesh, b: trimesh.Trimesh) -> Optional[trimesh.T
     return None
 
 
-def _boolean_diff(a: trimesh.Trimesh, b: trimesh.Trimesh) -> Optional[trimesh.Trimesh]:
+def _boolean_diff(a: trimesh.Trimesh, b: Tool) -> Optional[trimesh.Trimesh]:
     try:
-        from trimesh.boolean import difference
-        res = difference([a], [b], engine=None)
+        parts = [_as_volume(m) for m in _tool_parts(b)]
+        # la diferencia solo admite dos mallas: herramientas que se pisan se
+        # funden antes en una sola
+        tool = parts[0] if len(parts) == 1 else _tm_union(parts, engine=_ENGINE)
+        res = _tm_difference([_as_volume(a), tool], engine=_ENGINE)
         if isinstance(res, trimesh.Trimesh) and len(res.vertices):
             return res
     except Exception as e:
@@ -378,6 +663,80 @@ def _boolean_diff(a: trimesh.Trimesh, b: trimesh.Trimesh) -> Optional[trimesh.Tr
     return None
 
 
+def _mf_tool(tool: Tool):
+    """Herramienta como Manifold; las partes que se pisan se suman en él."""
+    parts = [_to_mf(_as_volume(m)) for m in _tool_parts(tool)]
+    if not parts or any(p is None for p in parts):
+        return None
+    acc = parts[0]
+    for p in parts[1:]:
+        acc = acc + p
+    return acc
+
+
+def _apply_booleans(
+    base: trimesh.Trimesh,
+    steps: List[Tuple[str, List[trimesh.Trimesh]]],
+) -> trimesh.Trimesh:
+    """
+    Aplica en orden los pasos ("diff" | "union", textos) sobre `base`. Con
+    manifold3d la pieza se convierte una sola vez y todos los pasos se
+    encadenan sobre el mismo Manifold: solo se vuelve a Trimesh al final.
+    Si algo no convierte, cada paso va por trimesh.boolean como antes.
+    """
+    if not steps:
+        return base
+    acc = _to_mf(_as_volume(base))
+    if acc is not None:
+        for op, group in steps:
+            tool = _mf_tool(_make_tool(group))
+            if tool is None:
+                break
+            acc = acc - tool if op == "diff" else acc + tool
+        else:
+            res = _mf_to_trimesh(acc)
+            if res is not None:
+                return res
+        _log("manifold session fail: trimesh.boolean por pasos")
+
+    out = base
+    for op, group in steps:
+        tool = _make_tool(group)
+        res = _boolean_diff(out, tool) if op == "diff" else _boolean_union(out, tool)
+        out = res if res is not None else _concat([out] + group)
+    return out
+
+
+def _touching(bounds: np.ndarray, meshes: List[trimesh.Trimesh]) -> np.ndarray:
+    """
+    Por malla: ¿su caja toca la caja `bounds` [[min], [max]]? Rechazo trivial
+    antes de un booleano (el contacto en una cara cuenta).
+    """
+    if not meshes:
+        return np.zeros(0, dtype=bool)
+    b = np.array([m.bounds for m in meshes])
+    return np.all((b[:, 0] <= bounds[1]) & (bounds[0] <= b[:, 1]), axis=1)
+
+
+# Caras máximas de una herramienta booleana. Las etiquetas normales caben de
+# sobra en una sola; textos enormes se aplican por tandas para acotar la
+# memoria de pico (herramienta + copia de trabajo del motor).
+_TOOL_MAX_FACES = 200_000
+
+
+def _batches(meshes: List[trimesh.Trimesh]) -> List[List[trimesh.Trimesh]]:
+    """Agrupa `meshes` en tandas consecutivas de como mucho `_TOOL_MAX_FACES` caras (mínimo una malla)."""
+    out: List[List[trimesh.Trimesh]] = []
+    size = 0
+    for m in meshes:
+        if not out or size + len(m.faces) > _TOOL_MAX_FACES:
+            out.append([])
+            size = 0
+        out[-1].append(m)
+        size += len(m.faces)
+    return out
+
+
 # ------------------------ API principal ------------------------ #
 
 def apply_text_ops(
@@ -395,9 +754,15 @@ def apply_text_ops(
       "font": "/ruta/a.ttf" | None,
       "anchor": "front"|"back"|"left"|"right"|"top"|"bottom"
     }
+    Los booleanos (y sus fallbacks) devuelven mallas nuevas y nunca tocan
+    `base_mesh`: sin copia previa. Si no se aplica ningún texto se devuelve
+    la propia `base_mesh`.
     """
-    out = base_mesh.copy()
+    out = base_mesh
 
+    # 1) Leer las ops, construir todos los sólidos (en paralelo) y posicionarlos
+    #    sobre la pieza base
+    specs = []
     for op in ops or []:
         text = (op.get("text") or "").strip()
         if not text:
@@ -413,22 +778,46 @@ def apply_text_ops(
         except Exception:
             px, py, pz = 0.0, 0.0, 0.0
         anchor: Anchor = op.get("anchor") or "front"
-
-        solid = _make_text_solid(text=text, height=size, depth=depth, font_spec=font_spec)
+        specs.append(((text, size, depth, font_spec), mode, (px, py, pz), anchor))
+    if not specs:
+        return base_mesh
+
+    solids = _make_text_solids([s[0] for s in specs])
+    # la caja de la pieza base se lee una vez: todas las ops se colocan sobre
+    # ella (los relieves no la desplazan)
+    box = _bounds_center_extents(base_mesh)
+    engrave: List[trimesh.Trimesh] = []
+    emboss: List[trimesh.Trimesh] = []
+    for ((_, _, depth, _), mode, pos3, anchor), solid in zip(specs, solids):
         if not isinstance(solid, trimesh.Trimesh) or len(solid.vertices) == 0:
             _log("skip: no solid for text")
             continue
 
         placed = _place_text_on_face(
-            text_mesh=solid, base=out, anchor=anchor, pos=(px, py, pz), depth=depth, mode=mode
+            text_mesh=solid, box=box, anchor=anchor, pos=pos3, depth=depth, mode=mode
         )
-
-        if mode == "emboss":
-            merged = _boolean_union(out, placed)
-            out = merged if merged is not None else _concat([out, placed])
-        else:
-            carved = _boolean_diff(out, placed)
-            out = carved if carved is not None else _concat([out, placed])
+        (emboss if mode == "emboss" else engrave).append(placed)
+
+    # 2) Como mucho dos booleanos: todos los grabados en un único cortador y
+    #    todos los relieves en una única herramienta (por tandas solo si pasan
+    #    de _TOOL_MAX_FACES). Lo que ni siquiera toca
+    #    la caja de la pieza no necesita booleano: un grabado fuera no quita
+    #    nada y un relieve separado (que no pisa a otro) es la simple
+    #    concatenación.
+    bounds = np.array(box[:2])
+    engrave = [m for m, hit in zip(engrave, _touching(bounds, engrave)) if hit]
+    steps = [("diff", group) for group in _batches(engrave)]
+    apart: List[trimesh.Trimesh] = []
+    if emboss:
+        # solo pasan por la unión los relieves que tocan la caja de la pieza o
+        # se pisan con otro relieve; el resto se añade tal cual al final
+        hits = _touching(bounds, emboss) | _clashing(emboss)
+        touching = [m for m, hit in zip(emboss, hits) if hit]
+        apart = [m for m, hit in zip(emboss, hits) if not hit]
+        steps += [("union", group) for group in _batches(touching)]
+    out = _apply_booleans(out, steps)
+    if apart:
+        out = _concat([out] + apart)
 
     return out
 
@@ -444,6 +833,7 @@ def place_text_layers(
     Devuelve la lista de mallas de texto ya posicionadas.
     """
     layers: List[trimesh.Trimesh] = []
+    box = None
     for op in ops or []:
         text = (op.get("text") or "").strip()
         if not text:
@@ -463,8 +853,10 @@ def place_text_layers(
         if not isinstance(solid, trimesh.Trimesh) or len(solid.vertices) == 0:
             continue
 
+        if box is None:
+            box = _bounds_center_extents(base_mesh)
         placed = _place_text_on_face(
-            text_mesh=solid, base=base_mesh, anchor=anchor, pos=(px, py, pz), depth=depth, mode=mode
+            text_mesh=solid, box=box, anchor=anchor, pos=(px, py, pz), depth=depth, mode=mode
         )
         layers.append(placed)
     return layers
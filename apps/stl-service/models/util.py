@@ -5,21 +5,28 @@ import math
 import numpy as np
 import trimesh as tm
 
+from ._helpers import box as _box, cylinder as _cylinder, mesh_difference, sections_for
+
+# Flecha máxima (mm) de cada cuerda en los taladros: por debajo del ancho de
+# boquilla FDM. Un agujero de M3 sale con 12 lados en vez de 48.
+DRILL_CHORD_TOL = 0.1
+
+# Rotaciones fijas del cilindro (eje +Z) hacia cada eje: se construyen una vez
+_AXIS_ROT = {
+    "z": np.eye(3),
+    # rotar Z->X: Ry(-90º)
+    "x": tm.transformations.rotation_matrix(-math.pi / 2, [0, 1, 0])[:3, :3],
+    # rotar Z->Y: Rx(+90º)
+    "y": tm.transformations.rotation_matrix(+math.pi / 2, [1, 0, 0])[:3, :3],
+}
+
+
 def _cyl_transform_at(x: float, y: float, z: float, axis: str):
     """
     Matriz 4x4 que orienta un cilindro (por defecto alineado a +Z)
     al eje indicado y lo coloca en (x,y,z).
     """
-    axis = (axis or "y").lower()
-    if axis == "z":
-        R = np.eye(3)
-    elif axis == "x":
-        # rotar Z->X: Ry(-90º)
-        R = tm.transformations.rotation_matrix(-math.pi / 2, [0, 1, 0])[:3, :3]
-    else:  # 'y'
-        # rotar Z->Y: Rx(+90º)
-        R = tm.transformations.rotation_matrix(+math.pi / 2, [1, 0, 0])[:3, :3]
-
+    R = _AXIS_ROT.get((axis or "y").lower(), _AXIS_ROT["y"])
     T = np.eye(4)
     T[:3, :3] = R
     T[:3,  3] = [x, y, z]
@@ -54,18 +61,17 @@ def drill_holes(mesh: tm.Trimesh, holes: list, bbox_lengths):
         y = float(h.get("y_mm", cy))
         z = float(h.get("z_mm", 0.0))
 
-        c = tm.creation.cylinder(radius=r, height=through, sections=48)
+        c = _cylinder(r, through, sections=sections_for(r, DRILL_CHORD_TOL, lo=12, hi=48))
         c.apply_transform(_cyl_transform_at(x, y, z, axis))
         cyls.append(c)
 
-    union_cyl = tm.util.concatenate(cyls) if len(cyls) > 1 else cyls[0]
-
     # ❌ Nada de engine="scad" – evita dependencia de OpenSCAD
-    out = mesh.difference(union_cyl)
-    return out
+    # Una sola resta con todos los cilindros (se unen antes; concatenarlos
+    # no da un volumen válido si se solapan)
+    return mesh_difference(mesh, cyls)
 
 def box(L: float, H: float, W: float, center=(0.0, 0.0, 0.0)) -> tm.Trimesh:
-    m = tm.creation.box(extents=[L, H, W])
+    m = _box((L, H, W))
     m.apply_translation(center)
     return m
 
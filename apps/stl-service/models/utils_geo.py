@@ -1,17 +1,155 @@
 # apps/stl-service/models/utils_geo.py
 from math import pi
-from typing import Iterable, List, Tuple
+from typing import Iterable, List, Optional, Tuple, Union
 
 import numpy as np
+import shapely
 import shapely.geometry as sg
-import shapely.affinity as sa
 from shapely.ops import unary_union
 import trimesh
+from trimesh.creation import triangulate_polygon
+
+from ._helpers import assemble_boxes, fast_concat, sections_for, translate
+
+
+# Tolerancia (mm) al simplificar el contorno antes de extruir: muy por debajo
+# de la resolución de una impresora FDM, pero elimina vértices casi colineales.
+SIMPLIFY_TOL = 0.05
+
+
+def _cap_triangles(poly: sg.Polygon, lens: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    """
+    Triangulación de la tapa con índices sin el punto de cierre de cada anillo.
+    Si earcut descarta triángulos nulos (vértices colineales entre anillos,
+    p. ej. '#') la tapa no cerraría con las paredes: se repite con el
+    triangulador de manifold, que los conserva.
+    """
+    # una tapa cerrada tiene n + 2*huecos - 2 triángulos
+    full = int(lens.sum() - len(lens)) + 2 * (len(lens) - 1) - 2
+    # los anillos vienen completos (con el punto de cierre repetido): ese
+    # punto se descarta y sus índices pasan al inicio del anillo
+    ends = np.cumsum(lens) - 1
+    remap = np.arange(int(lens.sum())) - np.repeat(np.arange(len(lens)), lens)
+    remap[ends] = starts
+
+    tri = None
+    for engine in (None, "manifold"):
+        try:
+            v2, f2 = triangulate_polygon(poly, engine=engine)
+        except Exception:
+            if tri is None:
+                raise
+            break
+        if len(v2) != len(remap):
+            raise ValueError("triangulación con vértices inesperados")
+        t = remap[np.asarray(f2, dtype=np.int64)]
+        # manifold usa también el punto de cierre: esos triángulos quedan
+        # degenerados tras el remapeo y se descartan
+        t = t[(t[:, 0] != t[:, 1]) & (t[:, 1] != t[:, 2]) & (t[:, 2] != t[:, 0])]
+        if tri is None or len(t) > len(tri):
+            tri = t
+        if len(tri) >= full:
+            break
+    return tri
+
+
+def _extrude_rings(poly: sg.Polygon, T: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Extruye un polígono (con huecos) de z=0 a z=T como arrays crudos.
+    Tapas: triangulación de earcut; paredes: un quad por arista de cada anillo,
+    compartiendo los vértices de las tapas (sólido cerrado sin merge posterior).
+    """
+    # Exterior CCW, huecos CW -> paredes hacia fuera. Igual que orient(poly, 1.0),
+    # pero con el área con signo en numpy y un solo constructor si hay que girar.
+    rings = [np.asarray(poly.exterior.coords)] + [np.asarray(r.coords) for r in poly.interiors]
+    flip = False
+    for k, r in enumerate(rings):
+        area = np.dot(r[:-1, 0], r[1:, 1]) - np.dot(r[1:, 0], r[:-1, 1])
+        if area < 0.0 if k == 0 else area > 0.0:
+            rings[k] = r[::-1]
+            flip = True
+    if flip:
+        poly = sg.Polygon(rings[0], rings[1:])
+    lens = np.array([len(r) for r in rings])
+    counts = lens - 1
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    xy = np.concatenate([r[:-1, :2] for r in rings])
+    n = len(xy)
+    tri = _cap_triangles(poly, lens, starts)
+
+    i = np.arange(n)
+    nxt = i + 1
+    nxt[starts + counts - 1] = starts
+
+    V = np.empty((2 * n, 3))
+    V[:n, :2] = xy
+    V[:n, 2] = 0.0
+    V[n:, :2] = xy
+    V[n:, 2] = float(T)
+    F = np.concatenate([
+        tri[:, ::-1],                               # tapa inferior (-Z)
+        tri + n,                                    # tapa superior (+Z)
+        np.column_stack([i, nxt, nxt + n]),         # paredes
+        np.column_stack([i, nxt + n, i + n]),
+    ])
+    return V, F
+
+
+def extrude_polygons(geom, T: float) -> Optional[trimesh.Trimesh]:
+    """
+    Extruye de Z=0 a Z=T un Polygon, MultiPolygon o lista de polígonos en una
+    sola malla (sin un Trimesh/merge por polígono). None si no queda nada.
+    """
+    if isinstance(geom, sg.base.BaseGeometry):
+        geom = getattr(geom, "geoms", [geom])
+    Vs: List[np.ndarray] = []
+    Fs: List[np.ndarray] = []
+    base = 0
+    for poly in geom:
+        if not poly.is_valid:
+            poly = poly.buffer(0)
+        if poly.is_empty:
+            continue
+        for part in getattr(poly, "geoms", [poly]):
+            V, F = _extrude_rings(part, T)
+            Vs.append(V)
+            Fs.append(F + base)
+            base += len(V)
+    if not Vs:
+        return None
+    return trimesh.Trimesh(vertices=np.concatenate(Vs), faces=np.concatenate(Fs), process=False)
+
+
+def _extrude(poly: sg.Polygon, T: float) -> trimesh.Trimesh:
+    """
+    Extruye `poly` con espesor T; si tiene agujeros, simplifica antes la triangulación.
+    Un MultiPolygon sale en una sola malla (extrude_polygons).
+    """
+    if isinstance(poly, sg.MultiPolygon):
+        return extrude_polygons(poly, T) or trimesh.Trimesh()
+    if not poly.is_empty and getattr(poly, "interiors", None):
+        poly = poly.simplify(SIMPLIFY_TOL, preserve_topology=True)
+    return trimesh.creation.extrude_polygon(poly, T)
+
+
+def extrude_centered(poly: sg.Polygon, T: float) -> trimesh.Trimesh:
+    """Extruye `poly` (plano XY) con espesor T centrado en Z=0, como un box()."""
+    return translate(_extrude(poly, T), (0.0, 0.0, -T / 2.0))
+
+
+def _circle_resolution(r: Union[float, np.ndarray]) -> Union[int, np.ndarray]:
+    """
+    Segmentos por cuadrante para que la flecha de cada cuerda no pase de
+    SIMPLIFY_TOL: agujeros pequeños salen con pocos lados, grandes con más.
+    Acepta también un ndarray de radios (ver `_circles`).
+    """
+    n = sections_for(r, SIMPLIFY_TOL, lo=8, hi=256)  # lados del círculo completo
+    return (n + 3) // 4  # 2..64 por cuadrante
 
 
 def circle(x: float, y: float, d: float) -> sg.Polygon:
     r = d / 2.0
-    return sg.Point(x, y).buffer(r, resolution=64)
+    return sg.Point(x, y).buffer(r, resolution=_circle_resolution(r))
 
 
 def slot(x: float, y: float, length: float, d: float, angle_deg: float = 0.0) -> sg.Polygon:
@@ -20,12 +158,84 @@ def slot(x: float, y: float, length: float, d: float, angle_deg: float = 0.0) ->
     length = longitud total (de centro a centro de los semicírculos).
     """
     r = d / 2.0
-    rect = sg.box(x - length / 2.0, y - r, x + length / 2.0, y + r)
-    caps = circle(x - length / 2.0, y, d).union(circle(x + length / 2.0, y, d))
-    poly = rect.union(caps)
+    if length <= 0.0:
+        return circle(x, y, d)
+    # Contorno analítico (dos semicírculos unidos por rectas), sin uniones
+    # booleanas de shapely: n segmentos por semicírculo.
+    n = max(8, sections_for(r) // 2)
+    t = np.linspace(-pi / 2.0, pi / 2.0, n + 1)
+    half = length / 2.0
+    px = np.concatenate([half + r * np.cos(t), -half - r * np.cos(t)])
+    py = np.concatenate([r * np.sin(t), -r * np.sin(t)])
     if angle_deg:
-        poly = sa.rotate(poly, angle_deg, origin=(x, y))
-    return poly
+        a = np.deg2rad(angle_deg)
+        ca, sa_ = np.cos(a), np.sin(a)
+        px, py = px * ca - py * sa_, px * sa_ + py * ca
+    return sg.Polygon(np.column_stack([px + x, py + y]))
+
+
+def _circles(h: np.ndarray) -> np.ndarray:
+    """
+    Círculos de un array (N, 3) de [x, y, d] con la API vectorizada de shapely 2:
+    un solo `shapely.buffer` por cada resolución distinta (normalmente una).
+    Mismo resultado que `circle()` agujero a agujero.
+    """
+    r = h[:, 2] / 2.0
+    q = _circle_resolution(r)
+    pts = shapely.points(h[:, 0], h[:, 1])
+    out = np.empty(len(h), dtype=object)
+    for qi in np.unique(q):
+        m = q == qi
+        out[m] = shapely.buffer(pts[m], r[m], quad_segs=int(qi))
+    return out
+
+
+def _components(n: int, i: np.ndarray, j: np.ndarray) -> np.ndarray:
+    """Etiqueta de componente conexa de cada nodo (pares i-j); numpy, sin scipy."""
+    labels = np.arange(n)
+    while True:
+        new = labels.copy()
+        np.minimum.at(new, i, labels[j])
+        new = new[new]  # salto de punteros: converge en pocas vueltas
+        if np.array_equal(new, labels):
+            return labels
+        labels = new
+
+
+def _holed_rect(x0: float, y0: float, x1: float, y1: float,
+                holes: Iterable[Tuple[float, float, float]]) -> sg.Polygon:
+    """
+    Rectángulo menos círculos (x, y, d). Los solapes se detectan con un STRtree:
+    los círculos aislados y dentro del rectángulo (lo normal) van directos como
+    interiores, los grupos que se solapan se unen solo entre sí, y únicamente lo
+    que toca el borde pasa por un `difference` de shapely.
+    """
+    outer = sg.box(x0, y0, x1, y1)
+    h = np.asarray(holes, dtype=np.float64).reshape(-1, 3)
+    if not len(h):
+        return outer
+    rings = _circles(h)
+    x, y, r = h[:, 0], h[:, 1], h[:, 2] / 2.0
+    inside = (x - r > x0) & (x + r < x1) & (y - r > y0) & (y + r < y1)
+
+    i, j = shapely.STRtree(rings).query(rings, predicate="intersects")
+    other = i != j
+    labels = _components(len(h), i[other], j[other])
+    sizes = np.bincount(labels, minlength=len(h))
+    comp_inside = np.ones(len(h), dtype=bool)
+    np.logical_and.at(comp_inside, labels, inside)
+
+    interiors = list(shapely.get_exterior_ring(rings[(sizes[labels] == 1) & inside]))
+    cut = list(rings[~comp_inside[labels]])
+    for lab in np.unique(labels[(sizes[labels] > 1) & comp_inside[labels]]):
+        group = unary_union(rings[labels == lab])
+        if isinstance(group, sg.Polygon) and not group.interiors:
+            interiors.append(group.exterior)
+        else:
+            cut.append(group)  # p. ej. un corro de agujeros que encierra una isla
+
+    poly = shapely.polygons(outer.exterior, holes=np.array(interiors, dtype=object) if interiors else None)
+    return poly.difference(unary_union(cut)) if cut else poly
 
 
 def plate_with_holes(L: float, W: float, T: float, holes: Iterable[Tuple[float, float, float]] = ()) -> trimesh.Trimesh:
@@ -33,18 +243,14 @@ def plate_with_holes(L: float, W: float, T: float, holes: Iterable[Tuple[float,
     Genera placa (XY) con agujeros circulares (x,z,d). Se extruye en +Y (espesor T).
     Origen en (0,0,0). Placa centrada en XZ y apoyada en Y=0.
     """
-    outer = sg.box(-L / 2.0, -W / 2.0, L / 2.0, W / 2.0)
-    rings: List[sg.Polygon] = []
-    for x, z, d in holes:
-        rings.append(circle(x, z, d))
-    interior = unary_union(rings) if rings else None
-    if interior:
-        poly = outer.difference(interior)
-    else:
-        poly = outer
-    mesh = trimesh.creation.extrude_polygon(poly, T)
+    holes = list(holes)
+    if not holes:
+        # caso habitual: una caja de 8 vértices, sin shapely ni triangulación
+        return assemble_boxes([((L, W, T), (0.0, T / 2.0, T / 2.0))])
+    poly = _holed_rect(-L / 2.0, -W / 2.0, L / 2.0, W / 2.0, holes)
+    mesh = _extrude(poly, T)
     # desplazar para apoyar en Y=0
-    mesh.apply_translation((0, T / 2.0, 0))
+    translate(mesh, (0, T / 2.0, 0))
     return mesh
 
 
@@ -52,20 +258,15 @@ def rectangle_plate(L: float, H: float, T: float, holes: Iterable[Tuple[float, f
     """
     Placa vertical (X por Y = altura) con agujeros (x,y,d). Se coloca centrada en X y Z=0.
     """
-    outer = sg.box(-L / 2.0, 0.0, L / 2.0, H)
-    rings: List[sg.Polygon] = []
-    for x, y, d in holes:
-        rings.append(circle(x, y, d))
-    interior = unary_union(rings) if rings else None
-    if interior:
-        poly = outer.difference(interior)
-    else:
-        poly = outer
-    mesh = trimesh.creation.extrude_polygon(poly, T)
-    mesh.apply_translation((0, T / 2.0, 0))
+    holes = list(holes)
+    if not holes:
+        return assemble_boxes([((L, H, T), (0.0, H / 2.0 + T / 2.0, T / 2.0))])
+    poly = _holed_rect(-L / 2.0, 0.0, L / 2.0, H, holes)
+    mesh = _extrude(poly, T)
+    translate(mesh, (0, T / 2.0, 0))
     return mesh
 
 
 def concatenate(meshes: List[trimesh.Trimesh]) -> trimesh.Trimesh:
     meshes = [m for m in meshes if m is not None]
-    return trimesh.util.concatenate(meshes) if len(meshes) > 1 else meshes[0]
+    return fast_concat(meshes) if len(meshes) > 1 else meshes[0]
@@ -1,65 +1,11 @@
 # apps/stl-service/models/vesa_adapter.py
 from __future__ import annotations
 
-from typing import Dict, Any, List, Tuple, Iterable, Optional
-import math
+from typing import Dict, Any, List, Tuple
 import trimesh
 
-# Si tienes estos helpers en tu repo, se usan. Si no, el builder funciona igualmente
-try:
-    from ._helpers import parse_holes as _parse_holes  # type: ignore
-except Exception:  # fallback simple por si no existe
-    def _parse_holes(holes_in: Iterable[Any]) -> List[Tuple[float, float, float]]:
-        """
-        Acepta:
-          - [(x,y,d), ...]
-          - [{"x_mm":..,"y_mm":..,"d_mm":..}, ...]
-        Devuelve lista [(x,y,d), ...] en mm.
-        """
-        out: List[Tuple[float, float, float]] = []
-        for h in holes_in or []:
-            if isinstance(h, dict):
-                x = float(h.get("x_mm", 0.0))
-                y = float(h.get("y_mm", 0.0))
-                d = float(h.get("d_mm", 0.0))
-                out.append((x, y, d))
-            elif isinstance(h, (list, tuple)) and len(h) >= 3:
-                out.append((float(h[0]), float(h[1]), float(h[2])))
-        return out
-
-try:
-    # Debe existir en tu repo. Reemplaza por tu util si el nombre difiere.
-    from .utils_geo import plate_with_holes  # type: ignore
-except Exception:
-    # Fallback mínimo por si no existe: genera una placa agujereada con trimesh
-    def plate_with_holes(L: float, W: float, T: float, holes: List[Tuple[float, float, float]]) -> trimesh.Trimesh:
-        """
-        Placa rectangular centrada en (0,0) de LxW y espesor T.
-        Agujeros cilíndricos pasantes en posiciones (x,y) con diámetro d.
-        (Fallback simplificado usando booleanas de trimesh)
-        """
-        base = trimesh.creation.box(extents=(L, W, T))
-        cutters: List[trimesh.Trimesh] = []
-        for (x, y, d) in holes:
-            r = d / 2.0
-            h = T * 1.2  # un poco más alto para garantizar corte pasante
-            cyl = trimesh.creation.cylinder(radius=r, height=h, sections=64)
-            cyl.apply_translation((x, y, 0.0))
-            cutters.append(cyl)
-
-        if not cutters:
-            return base
-
-        # Unir todos los cilindros en un solo mesh si es posible
-        if len(cutters) > 1:
-            cutter = trimesh.util.concatenate(cutters)
-        else:
-            cutter = cutters[0]
-
-        # Colocar centrado en Z para que atraviese
-        cutter.apply_translation((0.0, 0.0, 0.0))
-        result = base.difference(cutter, engine="scad" if trimesh.interfaces.scad.exists else None)
-        return result if isinstance(result, trimesh.Trimesh) else base
+from ._helpers import parse_holes as _parse_holes
+from .utils_geo import plate_with_holes
 
 
 NAME = "vesa_adapter"
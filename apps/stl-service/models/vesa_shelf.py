@@ -4,10 +4,14 @@
 from __future__ import annotations
 
 from typing import Dict, Any, Tuple, List, Optional
+import numpy as np
+import shapely.geometry as sg
 import trimesh
 
 # Booleanos tolerantes (sin engine="scad")
-from ._booleans import union as bool_union, difference as bool_difference
+from ._booleans import union as bool_union
+from ._helpers import box
+from .utils_geo import _extrude, _holed_rect
 
 DEFAULTS: Dict[str, Any] = {
     "vesa": 100.0,        # 75 / 100 / 200 (mm)
@@ -23,11 +27,17 @@ DEFAULTS: Dict[str, Any] = {
     "qr_offset_y": 12.0,  # desplazamiento de la ranura en +Z respecto al centro de la placa
 }
 
-def _box(extents: Tuple[float, float, float]) -> trimesh.Trimesh:
-    return trimesh.creation.box(extents=extents)
+def _xz_to_y(t: float) -> np.ndarray:
+    """Perfil (u, v) = (x, z) extruido w en [0, t]  ->  (x=u, y=w-t/2, z=v): placa centrada en Y."""
+    return np.array([
+        [1.0, 0.0, 0.0, 0.0],
+        [0.0, 0.0, 1.0, -t / 2.0],
+        [0.0, 1.0, 0.0, 0.0],
+        [0.0, 0.0, 0.0, 1.0],
+    ])
 
-def _cyl(radius: float, height: float, sections: int = 64) -> trimesh.Trimesh:
-    return trimesh.creation.cylinder(radius=radius, height=height, sections=sections)
+def _box(extents: Tuple[float, float, float]) -> trimesh.Trimesh:
+    return box(extents)
 
 def _move(m: trimesh.Trimesh, x=0.0, y=0.0, z=0.0) -> trimesh.Trimesh:
     out = m.copy()
@@ -48,15 +58,6 @@ def _safe_union(parts: List[Optional[trimesh.Trimesh]]) -> trimesh.Trimesh:
     res = bool_union(ps)
     return res if isinstance(res, trimesh.Trimesh) else trimesh.util.concatenate(ps)
 
-def _safe_diff(a: trimesh.Trimesh, cutters: List[Optional[trimesh.Trimesh]]) -> trimesh.Trimesh:
-    out = a.copy()
-    for c in cutters:
-        if not isinstance(c, trimesh.Trimesh) or c.vertices.shape[0] == 0:
-            continue
-        res = bool_difference(out, c)
-        out = res if isinstance(res, trimesh.Trimesh) else out
-    return out
-
 def make_model(params: Dict[str, Any]) -> trimesh.Trimesh:
     """
     Construye el estante VESA.
@@ -82,20 +83,18 @@ def make_model(params: Dict[str, Any]) -> trimesh.Trimesh:
     slot_h    = max(2.0, float(p.get("qr_slot_h", DEFAULTS["qr_slot_h"])))
     qr_off    = float(p.get("qr_offset_y", DEFAULTS["qr_offset_y"]))
 
-    # 1) Placa trasera (vesa + margen)
+    # 1) Placa trasera (vesa + margen) con taladros VESA y ranura QR: perfil
+    #    2D en XZ (agujeros restados en shapely) y una sola extrusión en Y
     margin = 40.0
     back_w = vesa + margin
     back_h = vesa + margin
-    back = _box((back_w, t, back_h))
-    back = _move(back, 0, 0, back_h / 2.0)
-
-    # 2) Taladros VESA
-    vesa_holes: List[trimesh.Trimesh] = []
-    for hx, hz in _vesa_hole_positions(vesa):
-        cyl = _cyl(radius=hole_d / 2.0, height=t * 2.0)
-        cyl = _move(cyl, hx, 0, back_h / 2.0 + hz)
-        vesa_holes.append(cyl)
-    back = _safe_diff(back, vesa_holes)
+    holes = [(hx, back_h / 2.0 + hz, hole_d) for hx, hz in _vesa_hole_positions(vesa)]
+    profile = _holed_rect(-back_w / 2.0, 0.0, back_w / 2.0, back_h, holes)
+    if qr_enable:
+        zc = back_h / 2.0 + qr_off
+        profile = profile.difference(sg.box(-slot_w / 2.0, zc - slot_h / 2.0, slot_w / 2.0, zc + slot_h / 2.0))
+    back = _extrude(profile, t)
+    back.apply_transform(_xz_to_y(t))  # trimesh corrige el sentido de las caras
 
     # 3) Estante (sale hacia -Y)
     shelf = _box((w, d, t))
@@ -105,24 +104,25 @@ def make_model(params: Dict[str, Any]) -> trimesh.Trimesh:
     lip = _box((w, t, lip_h))
     lip = _move(lip, 0, -(d + t) / 2.0, t / 2.0 + lip_h / 2.0)
 
-    # 5) Refuerzos
+    # 5) Refuerzos: una caja plantilla estampada en todas las X a la vez
     ribs_meshes: List[trimesh.Trimesh] = []
     if ribs > 0:
         step = w / (ribs + 1)
-        xs = [(-w / 2.0 + step * (i + 1)) for i in range(ribs)]
-        for x in xs:
-            rib = _box((t, d, t))
-            rib = _move(rib, x, -(d / 2.0 + t / 2.0), t / 2.0)
-            ribs_meshes.append(rib)
+        xs = -w / 2.0 + step * np.arange(1, ribs + 1, dtype=np.float64)
+        rib = _box((t, d, t))
+        nv = len(rib.vertices)
+        offs = np.zeros((ribs, 3))
+        offs[:, 0] = xs
+        offs[:, 1] = -(d / 2.0 + t / 2.0)
+        offs[:, 2] = t / 2.0
+        rv = rib.vertices.view(np.ndarray)
+        rf = rib.faces.view(np.ndarray)
+        V = (rv[None, :, :] + offs[:, None, :]).reshape(-1, 3)
+        F = (rf[None, :, :] + nv * np.arange(ribs)[:, None, None]).reshape(-1, 3)
+        ribs_meshes.append(trimesh.Trimesh(vertices=V, faces=F, process=False))
 
     model = _safe_union([back, shelf, lip] + ribs_meshes)
 
-    # 6) Quick-release (ranura rectangular)
-    if qr_enable:
-        slot = _box((slot_w, t * 2.0, slot_h))
-        slot = _move(slot, 0, 0, back_h / 2.0 + qr_off)
-        model = _safe_diff(model, [slot])
-
     model = model.copy()
     model.metadata = {"name": "vesa_shelf", "unit": "mm"}
     return model
@@ -3,6 +3,8 @@
 import math
 from typing import List, Tuple
 
+import numpy as np
+
 Vec3 = Tuple[float, float, float]
 Tri = Tuple[Vec3, Vec3, Vec3]
 
@@ -14,16 +16,32 @@ def _normal(a: Vec3, b: Vec3, c: Vec3) -> Vec3:
     length = math.sqrt(nx*nx + ny*ny + nz*nz) or 1.0
     return (nx/length, ny/length, nz/length)
 
+# Una faceta completa: normal (3) + 3 vértices (9) = 12 valores.
+# 6 decimales (1 nm) sobran para mm y formatean mucho más rápido que repr().
+_FACET = (
+    "  facet normal %.6f %.6f %.6f\n"
+    "    outer loop\n"
+    "      vertex %.6f %.6f %.6f\n"
+    "      vertex %.6f %.6f %.6f\n"
+    "      vertex %.6f %.6f %.6f\n"
+    "    endloop\n"
+    "  endfacet"
+)
+
+def _normals(t: np.ndarray) -> np.ndarray:
+    """Normales unitarias de un array (n,3,3) de triángulos (misma fórmula que `_normal`)."""
+    n = np.cross(t[:, 1] - t[:, 0], t[:, 2] - t[:, 0])
+    length = np.sqrt((n * n).sum(axis=1))
+    length[length == 0.0] = 1.0
+    return n / length[:, None]
+
 def triangles_to_stl(name: str, tris: List[Tri]) -> bytes:
     lines = [f"solid {name}"]
-    for (a,b,c) in tris:
-        nx,ny,nz = _normal(a,b,c)
-        lines.append(f"  facet normal {nx} {ny} {nz}")
-        lines.append("    outer loop")
-        for v in (a,b,c):
-            lines.append(f"      vertex {v[0]} {v[1]} {v[2]}")
-        lines.append("    endloop")
-        lines.append("  endfacet")
+    if len(tris):
+        t = np.asarray(tris, dtype=np.float64).reshape(-1, 3, 3)
+        vals = np.hstack([_normals(t), t.reshape(-1, 9)])
+        # normales en bloque; luego un único formateo por faceta
+        lines.extend(_FACET % tuple(row) for row in vals.tolist())
     lines.append(f"endsolid {name}")
     return ("\n".join(lines) + "\n").encode("utf-8")
 
@@ -69,3 +87,32 @@ def add_cylinder_z(tris: List[Tri], cx: float, cy: float, z0: float, z1: float,
         xC,yC = cx + radius*math.cos((i+1)*ang), cy + radius*math.sin((i+1)*ang)
         tris.append(((xA,yA,z0), (xB,yB,z0), (xC,yC,z0)))  # base
         tris.append(((xA,yA,z1), (xC,yC,z1), (xB,yB,z1)))  # tapa
+
+# ---- STL binario ----
+# Registro de 50 bytes por triángulo: normal + 3 vértices (float32 LE) + atributo.
+_STL_DTYPE = np.dtype([
+    ("n", "<f4", (3,)),
+    ("v0", "<f4", (3,)),
+    ("v1", "<f4", (3,)),
+    ("v2", "<f4", (3,)),
+    ("attr", "<u2"),
+])
+
+def mesh_to_stl_bytes(mesh, header: bytes = b"teknovashop-forge") -> bytes:
+    """STL binario de una malla con `.vertices`/`.faces`, armado en bloque con numpy."""
+    # Trimesh guarda float64, pero el STL es float32: se convierte una vez por
+    # vértice (no por esquina) y el gather y las normales van a media anchura.
+    v = np.asarray(mesh.vertices, dtype=np.float32)
+    f = np.asarray(mesh.faces, dtype=np.int64).reshape(-1, 3)
+    t = v[f]  # (n,3,3) float32
+    rec = np.zeros(len(f), dtype=_STL_DTYPE)
+    if len(f):
+        rec["n"] = _normals(t)
+        rec["v0"] = t[:, 0]
+        rec["v1"] = t[:, 1]
+        rec["v2"] = t[:, 2]
+    return b"".join([
+        header[:80].ljust(80, b"\0"),
+        np.uint32(len(f)).astype("<u4").tobytes(),
+        rec.tobytes(),
+    ])
@@ -8,17 +8,24 @@ def _qr_mesh(url: str, pixel: float = 0.8, thickness: float = 0.6) -> trimesh.Tr
     qr = qrcode.QRCode(border=1, box_size=1)
     qr.add_data(url)
     qr.make(fit=True)
-    m = qr.get_matrix()  # bool matrix
-    h = len(m); w = len(m[0])
-    cubes=[]
+    m = np.asarray(qr.get_matrix(), dtype=bool)  # bool matrix
+    h, w = m.shape
+    jj, ii = np.nonzero(m)
+    if not len(ii):
+        return trimesh.creation.box([0.1,0.1,0.1])
     offx, offz = -w*pixel/2, -h*pixel/2
-    for j,row in enumerate(m):
-        for i,val in enumerate(row):
-            if not val: continue
-            b = trimesh.creation.box(extents=[pixel, thickness, pixel])
-            b.apply_transform(T([offx + i*pixel + pixel/2, 0, offz + j*pixel + pixel/2]))
-            cubes.append(b)
-    return trimesh.util.concatenate(cubes) if cubes else trimesh.creation.box([0.1,0.1,0.1])
+    # centros (N,3) de todos los píxeles activos de una vez
+    centers = np.column_stack([
+        offx + ii*pixel + pixel/2,
+        np.zeros(len(ii)),
+        offz + jj*pixel + pixel/2,
+    ])
+    # una caja plantilla estampada N veces (vértices y caras en bloque)
+    tpl = trimesh.creation.box(extents=[pixel, thickness, pixel])
+    nv = len(tpl.vertices)
+    V = (tpl.vertices[None, :, :] + centers[:, None, :]).reshape(-1, 3)
+    F = (tpl.faces[None, :, :] + nv*np.arange(len(ii))[:, None, None]).reshape(-1, 3)
+    return trimesh.Trimesh(vertices=V, faces=F, process=False)
 
 def add_watermark_plaque(mesh: trimesh.Trimesh, qr_url: str, text: str = "FORGE") -> trimesh.Trimesh:
     """